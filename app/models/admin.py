@@ -1,3 +1,4 @@
+from flask import current_app
 from app import db
 from werkzeug.security import generate_password_hash, check_password_hash
 
@@ -10,7 +11,8 @@ class Admin(db.Model):
     passwordHash = db.Column(db.String(128), nullable=False)
     
     def setPassword(self, password):
-        self.passwordHash = generate_password_hash(password)
+        method = current_app.config.get('PASSWORD_HASH_METHOD', 'scrypt')
+        self.passwordHash = generate_password_hash(password, method=method)
     
     def checkPassword(self, password):
         return check_password_hash(self.passwordHash, password)
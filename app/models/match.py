@@ -1,5 +1,14 @@
 from app import db
 
+# Bracket round labels; later rounds fall back to 'Round N'
+ROUND_NAMES = {
+    1: 'Round 1',
+    2: 'Quarter-final',
+    3: 'Semi-final',
+    4: 'Final',
+    5: 'Championship'
+}
+
 
 class Match(db.Model):
     __tablename__ = 'match'
@@ -51,14 +60,7 @@ class Match(db.Model):
         if self.is_play_in:
             return 'Play-in Match'
 
-        round_names = {
-            1: 'Round 1',
-            2: 'Quarter-final',
-            3: 'Semi-final',
-            4: 'Final',
-            5: 'Championship'
-        }
-        return round_names.get(self.round_number, f'Round {self.round_number}')
+        return ROUND_NAMES.get(self.round_number, f'Round {self.round_number}')
 
     @property
     def is_ready(self):
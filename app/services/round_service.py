@@ -1,6 +1,7 @@
 """Service layer for round management in multi-round games."""
 from app import db
 from app.models import Round, RoundScore, Game, Team
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 
 MAX_ROUNDS = 50
@@ -41,22 +42,21 @@ class RoundService:
         if existing_rounds > 0:
             raise ValueError(f"Game {game_id} already has rounds. Delete existing rounds first.")
 
-        rounds = []
         descriptions = descriptions or []
 
         try:
-            for i in range(1, number_of_rounds + 1):
-                description = descriptions[i - 1] if i - 1 < len(descriptions) else None
-                round_obj = Round(
-                    game_id=game_id,
-                    round_number=i,
-                    description=description
-                )
-                db.session.add(round_obj)
-                rounds.append(round_obj)
-
+            # One executemany INSERT; adding Round objects would flush them
+            # with a separate INSERT ... RETURNING per row on SQLite
+            db.session.execute(insert(Round), [
+                {
+                    'game_id': game_id,
+                    'round_number': i,
+                    'description': descriptions[i - 1] if i - 1 < len(descriptions) else None
+                }
+                for i in range(1, number_of_rounds + 1)
+            ])
             db.session.commit()
-            return rounds
+            return RoundService.get_rounds_for_game(game_id)
         except SQLAlchemyError as e:
             db.session.rollback()
             raise SQLAlchemyError(f"Error creating rounds: {str(e)}")
@@ -3,6 +3,8 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from sqlalchemy.pool import StaticPool
+
 # Get absolute path to project root
 BASE_DIR = Path(__file__).resolve().parent
 INSTANCE_DIR = BASE_DIR / 'instance'
@@ -33,6 +35,9 @@ class Config:
     DEVADMIN_USERNAME = os.environ.get('DEVADMIN_USERNAME', 'devadmin')
     DEVADMIN_PASSWORD = os.environ.get('DEVADMIN_PASSWORD', 'devpassword')
 
+    # Werkzeug password hashing method (verification reads it from the hash)
+    PASSWORD_HASH_METHOD = 'scrypt'
+
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 
     # Feedback settings
@@ -60,9 +65,16 @@ class TestingConfig(Config):
     DEBUG = False
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # Every session shares one in-memory connection, so the schema is built
+    # once and per-test SAVEPOINTs see the same database
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False},
+    }
     SQLALCHEMY_ECHO = False
     WTF_CSRF_ENABLED = False
     RATELIMIT_ENABLED = False  # Disable rate limiting in tests
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1'  # Cheap KDF, tests don't need brute-force resistance
 
 
 class ProductionConfig(Config):
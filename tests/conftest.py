@@ -1,41 +1,103 @@
 """Pytest configuration and fixtures."""
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
 from app import create_app, db
 from app.models import Admin, Team, Participant, Game, Score, GameNight, Tournament, Match, Penalty
+from tests.utils import bound_session
+
+
+def _disable_pysqlite_transactions(dbapi_conn, connection_record):
+    """Stop pysqlite from managing transactions on its own."""
+    dbapi_conn.isolation_level = None
+
+
+def _relax_durability(dbapi_conn, connection_record):
+    """Skip fsyncs and on-disk journals; test data never needs to survive a crash."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+
+
+def _emit_begin(conn):
+    """Emit BEGIN explicitly when SQLAlchemy starts a transaction."""
+    conn.exec_driver_sql('BEGIN')
 
 
 @pytest.fixture(scope='session')
 def app():
-    """Create application for testing."""
+    """Create application for testing.
+
+    The schema is created once here and shared by every test; db_session
+    isolates tests by rolling back instead of dropping tables.
+    """
     app = create_app('testing')
 
     with app.app_context():
+        # pysqlite defers BEGIN until the first DML statement, which breaks
+        # the SAVEPOINTs db_session relies on. Let SQLAlchemy emit BEGIN and
+        # reopen the in-memory connection so the connect hooks apply.
+        event.listen(db.engine, 'connect', _disable_pysqlite_transactions)
+        event.listen(db.engine, 'connect', _relax_durability)
+        event.listen(db.engine, 'begin', _emit_begin)
+        db.engine.dispose()
+
         db.create_all()
         yield app
         db.session.remove()
-        # Disable foreign keys temporarily for drop
-        db.session.execute(db.text('PRAGMA foreign_keys=OFF'))
-        db.drop_all()
-        db.session.execute(db.text('PRAGMA foreign_keys=ON'))
+        # Discarding the pooled connection drops the in-memory database
+        db.engine.dispose()
+
+
+@pytest.fixture(scope='session')
+def db_connection(app):
+    """Connection shared by every test that touches the database.
+
+    Its outer transaction is never committed. Seeded fixtures and tests
+    each work inside their own SAVEPOINT on top of it.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope='function')
-def db_session(app):
-    """Create a new database session for a test."""
+def db_session(app, db_connection):
+    """Create a new database session for a test.
+
+    The test runs inside a SAVEPOINT that is rolled back on teardown.
+    db.session joins it through nested SAVEPOINTs, so commits and
+    rollbacks made by the code under test stay inside the test.
+    """
     with app.app_context():
-        # Create all tables
-        db.create_all()
+        savepoint = db_connection.begin_nested()
+        with bound_session(db_connection) as session:
+            yield session
+        if savepoint.is_active:
+            savepoint.rollback()
 
-        yield db.session
 
-        # Rollback any changes and remove session
-        db.session.rollback()
-        db.session.remove()
+def _raise_on_lazy_load(orm_execute_state):
+    """Add raiseload('*') to every ORM SELECT the session runs."""
+    if orm_execute_state.is_select:
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload('*'))
+
+
+@pytest.fixture
+def strict_loading(db_session):
+    """Make relationships on instances loaded during the test raise on access.
 
-        # Disable foreign keys temporarily for drop
-        db.session.execute(db.text('PRAGMA foreign_keys=OFF'))
-        db.drop_all()
-        db.session.execute(db.text('PRAGMA foreign_keys=ON'))
+    Code under test must eager-load what it uses, so an N+1 lazy load
+    fails the test instead of quietly adding a query per row.
+    """
+    session = db_session()
+    event.listen(session, 'do_orm_execute', _raise_on_lazy_load)
+    yield
+    event.remove(session, 'do_orm_execute', _raise_on_lazy_load)
 
 
 @pytest.fixture(scope='function')
@@ -46,14 +108,25 @@ def client(app, db_session):
     return app.test_client()
 
 
+@pytest.fixture(scope='session')
+def admin_id(app, db_connection):
+    """Seed the test admin once for the whole run.
+
+    The row lives in db_connection's outer transaction, so the password
+    is hashed a single time and every test sees the same admin.
+    """
+    with app.app_context(), bound_session(db_connection) as session:
+        admin = Admin(username='testadmin')
+        admin.setPassword('testpassword123')
+        session.add(admin)
+        session.commit()
+        return admin.id
+
+
 @pytest.fixture
-def admin_user(db_session):
-    """Create a test admin user."""
-    admin = Admin(username='testadmin')
-    admin.setPassword('testpassword123')
-    db_session.add(admin)
-    db_session.commit()
-    return admin
+def admin_user(db_session, admin_id):
+    """Load the test admin user into this test's session."""
+    return db_session.get(Admin, admin_id)
 
 
 @pytest.fixture
@@ -1,8 +1,63 @@
 """Test data factories for creating test fixtures."""
 from datetime import date
+from functools import lru_cache
+from sqlalchemy import insert
 from app.models import GameNight, Team, Game, Participant, Score, Admin, Tournament, Match, Penalty
 
 
+# Session.info flag set by tests.utils.single_commit()
+DEFER_COMMIT = 'defer_commit'
+
+
+def _commit(db_session):
+    """Commit, or only flush inside single_commit()."""
+    if db_session.info.get(DEFER_COMMIT):
+        db_session.flush()
+    else:
+        db_session.commit()
+
+
+def _save(db_session, instance):
+    """Add instance and commit it (see _commit)."""
+    db_session.add(instance)
+    _commit(db_session)
+
+
+@lru_cache(maxsize=None)
+def _insert_returning_id(table):
+    """Build the INSERT ... RETURNING id statement for table once."""
+    return insert(table).returning(table.c.id)
+
+
+def _insert_rows(db_session, model, rows):
+    """Insert rows with one multi-row INSERT and return their new ids in order.
+
+    Asking SQLAlchemy to sort RETURNING rows makes SQLite fall back to one
+    INSERT per row. Autoincrement ids are handed out in VALUES order, so
+    sorting them gives the same order without losing the batch.
+    """
+    result = db_session.execute(_insert_returning_id(model.__table__), rows)
+    return sorted(result.scalars().all())
+
+
+def bulk_insert(db_session, model, rows):
+    """Insert many rows with one Core statement, bypassing the ORM unit of work.
+
+    Use for setup rows a test only needs to query back, not as instances.
+
+    Args:
+        db_session: Database session
+        model: Model class whose table receives the rows
+        rows: List of column/value dicts (all with the same keys)
+
+    Returns:
+        List of generated primary keys, in the order of rows
+    """
+    ids = _insert_rows(db_session, model, rows)
+    _commit(db_session)
+    return ids
+
+
 class GameNightFactory:
     """Factory for creating GameNight instances."""
 
@@ -32,8 +87,7 @@ class GameNightFactory:
             is_working_context=is_working_context,
             is_completed=is_completed
         )
-        db_session.add(gn)
-        db_session.commit()
+        _save(db_session, gn)
         return gn
 
 
@@ -67,32 +121,40 @@ class TeamFactory:
             )
             db_session.add(participant)
 
-        db_session.commit()
+        _save(db_session, team)
         return team
 
     @staticmethod
-    def create_batch(db_session, count=3, game_night_id=None, **kwargs):
+    def create_batch(db_session, count=3, game_night_id=None,
+                     color='#3b82f6', participant_count=2):
         """Create multiple teams at once.
 
+        Teams and their participants are each written with one multi-row
+        INSERT rather than a round trip per row.
+
         Args:
             db_session: Database session
             count: Number of teams to create
             game_night_id: ID of associated game night
-            **kwargs: Additional arguments passed to create()
+            color: Team color (hex code)
+            participant_count: Number of participants per team (0-6)
 
         Returns:
-            List of Team instances
+            List of Team instances named 'Team 1' to 'Team {count}'
         """
-        teams = []
-        for i in range(1, count + 1):
-            team = TeamFactory.create(
-                db_session,
-                name=f'Team {i}',
-                game_night_id=game_night_id,
-                **kwargs
-            )
-            teams.append(team)
-        return teams
+        team_ids = _insert_rows(db_session, Team, [
+            {'name': f'Team {i}', 'color': color, 'game_night_id': game_night_id}
+            for i in range(1, count + 1)
+        ])
+        if participant_count:
+            _insert_rows(db_session, Participant, [
+                {'firstName': f'Player{i+1}', 'lastName': 'Doe', 'team_id': team_id}
+                for team_id in team_ids
+                for i in range(participant_count)
+            ])
+        _commit(db_session)
+
+        return db_session.query(Team).filter(Team.id.in_(team_ids)).order_by(Team.id).all()
 
 
 class GameFactory:
@@ -131,8 +193,7 @@ class GameFactory:
             isCompleted=is_completed,
             public_input=public_input
         )
-        db_session.add(game)
-        db_session.commit()
+        _save(db_session, game)
         return game
 
 
@@ -161,8 +222,7 @@ class ScoreFactory:
             score_value=score_value,
             notes=notes
         )
-        db_session.add(score)
-        db_session.commit()
+        _save(db_session, score)
         return score
 
 
@@ -183,8 +243,7 @@ class AdminFactory:
         """
         admin = Admin(username=username)
         admin.setPassword(password)
-        db_session.add(admin)
-        db_session.commit()
+        _save(db_session, admin)
         return admin
 
 
@@ -212,8 +271,7 @@ class TournamentFactory:
             bracket_style=bracket_style,
             public_edit=public_edit
         )
-        db_session.add(tournament)
-        db_session.commit()
+        _save(db_session, tournament)
         return tournament
 
 
@@ -247,8 +305,7 @@ class MatchFactory:
             status=status,
             is_bye=is_bye
         )
-        db_session.add(match)
-        db_session.commit()
+        _save(db_session, match)
         return match
 
 
@@ -275,6 +332,5 @@ class PenaltyFactory:
             value=value,
             stackable=stackable
         )
-        db_session.add(penalty)
-        db_session.commit()
+        _save(db_session, penalty)
         return penalty
@@ -2,8 +2,28 @@
 Unit tests for team forms.
 Implements Black-Box Testing: Equivalence Partitioning and BVA for color codes.
 """
+from functools import lru_cache
+
 import pytest
 from app.forms import TeamForm
+from app.utils.validators import PARTICIPANT_NAME_MAX
+
+# Known-valid form data. Partition tests override a single field; the color
+# tests validate only the color field, test_valid_team_form the full form.
+VALID_TEAM_DATA = {
+    'name': 'Test Team',
+    'color': '#FF0000',
+    'participant1FirstName': 'John',
+    'participant1LastName': 'Doe',
+    'participant2FirstName': 'Jane',
+    'participant2LastName': 'Smith'
+}
+
+
+@lru_cache(maxsize=None)
+def _name_of_length(length):
+    """Build (once per length) a name string for boundary-value tests."""
+    return 'A' * length
 
 
 @pytest.mark.unit
@@ -43,17 +63,10 @@ class TestTeamForm:
             '#ABCDEF',  # Uppercase
         ]
 
-        for color in valid_colors:
-            with app.test_request_context():
-                form = TeamForm(data={
-                    'name': 'Test Team',
-                    'color': color,
-                    'participant1FirstName': 'John',
-                    'participant1LastName': 'Doe',
-                    'participant2FirstName': 'Jane',
-                    'participant2LastName': 'Smith'
-                })
-                assert form.validate() is True, f"Color {color} should be valid"
+        with app.test_request_context():
+            for color in valid_colors:
+                form = TeamForm(data={**VALID_TEAM_DATA, 'color': color})
+                assert form.color.validate(form) is True, f"Color {color} should be valid"
 
     # Equivalence Partitioning: Invalid hex colors
     def test_invalid_hex_colors(self, app):
@@ -70,17 +83,10 @@ class TestTeamForm:
             '',          # Empty
         ]
 
-        for color in invalid_colors:
-            with app.test_request_context():
-                form = TeamForm(data={
-                    'name': 'Test Team',
-                    'color': color,
-                    'participant1FirstName': 'John',
-                    'participant1LastName': 'Doe',
-                    'participant2FirstName': 'Jane',
-                    'participant2LastName': 'Smith'
-                })
-                assert form.validate() is False, f"Color {color} should be invalid"
+        with app.test_request_context():
+            for color in invalid_colors:
+                form = TeamForm(data={**VALID_TEAM_DATA, 'color': color})
+                assert form.color.validate(form) is False, f"Color {color} should be invalid"
                 assert 'color' in form.errors
 
     # BVA: Empty team name
@@ -207,17 +213,16 @@ class TestTeamForm:
             })
             assert form.validate() is True
 
-    def test_very_long_participant_names(self, app):
-        """Test very long participant names should fail validation."""
+    @pytest.mark.slow
+    @pytest.mark.parametrize('length', [PARTICIPANT_NAME_MAX + 1, 100, 150, 200, 300])
+    def test_very_long_participant_names(self, app, length):
+        """Test participant names over the maximum length fail validation - BVA."""
         with app.test_request_context():
-            long_name = 'A' * 200
+            long_name = _name_of_length(length)
             form = TeamForm(data={
-                'name': 'Test Team',
-                'color': '#FF0000',
+                **VALID_TEAM_DATA,
                 'participant1FirstName': long_name,
-                'participant1LastName': long_name,
-                'participant2FirstName': 'Jane',
-                'participant2LastName': 'Smith'
+                'participant1LastName': long_name
             })
             assert form.validate() is False
             assert 'participant1FirstName' in form.errors or 'participant1LastName' in form.errors
@@ -237,6 +242,7 @@ class TestTeamForm:
             assert form.validate() is True
 
     # Edge case: Unicode in names
+    @pytest.mark.slow
     def test_unicode_in_names(self, app):
         """Test unicode characters in participant names."""
         with app.test_request_context():
@@ -3,78 +3,37 @@
 Test IDs: FORM-T-001 through FORM-T-009
 Coverage: TournamentSetupForm, MatchScoreForm validation
 """
+import itertools
+
 import pytest
 from app.forms.tournament_forms import TournamentSetupForm, MatchScoreForm
 
 
 @pytest.mark.unit
 @pytest.mark.forms
+@pytest.mark.usefixtures('app')
 class TestTournamentForms:
     """Test suite for Tournament forms."""
 
-    def test_tournament_setup_form_valid(self):
-        """FORM-T-001: Test valid tournament setup form."""
-        form = TournamentSetupForm(data={
-            'game_id': '1',
-            'pairing_type': 'random',
-            'bracket_style': 'standard',
-            'public_edit': False
-        })
-
-        assert form.validate() or len(form.errors) == 0
-
-    def test_tournament_setup_pairing_type_choices(self):
-        """FORM-T-002: Test pairing_type must be 'random' or 'manual'."""
-        form_random = TournamentSetupForm(data={
-            'game_id': '1',
-            'pairing_type': 'random',
-            'bracket_style': 'standard',
-            'public_edit': False
-        })
-
-        form_manual = TournamentSetupForm(data={
-            'game_id': '1',
-            'pairing_type': 'manual',
-            'bracket_style': 'standard',
-            'public_edit': False
-        })
-
-        # Both should be valid
-        assert form_random.validate() or 'pairing_type' not in form_random.errors
-        assert form_manual.validate() or 'pairing_type' not in form_manual.errors
-
-    def test_tournament_setup_bracket_style_choices(self):
-        """FORM-T-003: Test bracket_style must be 'standard' or 'play_in'."""
-        form = TournamentSetupForm(data={
-            'game_id': '1',
-            'pairing_type': 'random',
-            'bracket_style': 'standard',
-            'public_edit': False
-        })
-
-        assert form.validate() or 'bracket_style' not in form.errors
-
-    def test_tournament_setup_public_edit_boolean(self):
-        """FORM-T-004: Test public_edit boolean field."""
-        form = TournamentSetupForm(data={
-            'game_id': '1',
-            'pairing_type': 'random',
-            'bracket_style': 'standard',
-            'public_edit': True
-        })
-
-        assert form.validate() or 'public_edit' not in form.errors
-
-    def test_tournament_setup_game_id_hidden(self):
-        """FORM-T-005: Test game_id hidden field."""
+    @pytest.mark.parametrize('pairing_type,bracket_style,public_edit', list(itertools.product(
+        ['random', 'manual'],
+        ['standard', 'play_in'],
+        [True, False]
+    )))
+    def test_tournament_setup_form_valid(self, pairing_type, bracket_style, public_edit):
+        """FORM-T-001 to FORM-T-005: Test every valid setup choice combination."""
         form = TournamentSetupForm(data={
             'game_id': '123',
-            'pairing_type': 'random',
-            'bracket_style': 'standard',
-            'public_edit': False
+            'pairing_type': pairing_type,
+            'bracket_style': bracket_style,
+            'public_edit': public_edit
         })
 
-        assert form.game_id.data == '123' or form.validate()
+        assert form.validate() is True
+        assert form.game_id.data == '123'
+        assert form.pairing_type.data == pairing_type
+        assert form.bracket_style.data == bracket_style
+        assert form.public_edit.data is public_edit
 
     def test_match_score_form_valid(self):
         """FORM-T-006: Test valid match score form."""
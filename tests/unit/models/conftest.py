@@ -0,0 +1,112 @@
+"""Fixtures shared by the model tests."""
+from types import SimpleNamespace
+
+import pytest
+from app.models import Game, Round, Team, Tournament
+from tests.factories import GameFactory, GameNightFactory, TeamFactory, TournamentFactory
+from tests.utils import seeded_row, seeded_savepoint, single_commit
+
+
+@pytest.fixture
+def db_session(db_session):
+    """Run the model tests without autoflush or expire-on-commit.
+
+    These tests build instances and assert on them, flushing explicitly
+    when they need the database and reading attributes back after a
+    commit without reloading the row. The service and integration tests
+    keep both defaults, as they are in production.
+    """
+    session = db_session()
+    session.autoflush = False
+    session.expire_on_commit = False
+    yield db_session
+    session.autoflush = True
+    session.expire_on_commit = True
+
+
+@pytest.fixture
+def commit_once(db_session):
+    """Let factories flush instead of committing; commit once per test.
+
+    Apply with usefixtures to tests that build several rows through the
+    factories. Tests with their own single_commit block shouldn't use it,
+    since a nested block only flushes.
+    """
+    with single_commit(db_session):
+        yield
+
+
+def _seed_games(session):
+    """Insert a score game, a time game and a team on one game night."""
+    game_night = GameNightFactory.create(session)
+    score_game = GameFactory.create(
+        session,
+        name='Score Game',
+        game_night_id=game_night.id,
+        metric_type='score'
+    )
+    time_game = GameFactory.create(
+        session,
+        name='Time Game',
+        game_night_id=game_night.id,
+        sequence_number=2,
+        metric_type='time',
+        scoring_direction='lower_better'
+    )
+    team = TeamFactory.create(session, game_night_id=game_night.id)
+    return SimpleNamespace(
+        game_night_id=game_night.id,
+        score_game_id=score_game.id,
+        time_game_id=time_game.id,
+        team_id=team.id
+    )
+
+
+def _seed_tournament(session):
+    """Insert one GameNight -> Game -> Tournament chain."""
+    game_night = GameNightFactory.create(session)
+    game = GameFactory.create(session, game_night_id=game_night.id)
+    tournament = TournamentFactory.create(session, game_id=game.id)
+    return SimpleNamespace(
+        game_night_id=game_night.id,
+        game_id=game.id,
+        tournament_id=tournament.id
+    )
+
+
+def _seed_round(session):
+    """Insert a game with one round."""
+    game_night = GameNightFactory.create(session)
+    game = GameFactory.create(session, game_night_id=game_night.id)
+    round_obj = Round(game_id=game.id, round_number=1)
+    session.add(round_obj)
+    session.commit()
+    return SimpleNamespace(game_id=game.id, round_id=round_obj.id)
+
+
+@pytest.fixture(scope='module')
+def game_ids(app, db_connection):
+    """Seed a score game, a time game and a team for a whole module."""
+    with seeded_savepoint(app, db_connection, _seed_games) as ids:
+        yield ids
+
+
+@pytest.fixture(scope='class')
+def class_tournament(app, db_connection):
+    """Seed one GameNight -> Game -> Tournament chain for a whole test class."""
+    with seeded_savepoint(app, db_connection, _seed_tournament) as ids:
+        yield ids
+
+
+@pytest.fixture(scope='class')
+def class_round(app, db_connection):
+    """Seed a game with one round for a whole test class."""
+    with seeded_savepoint(app, db_connection, _seed_round) as ids:
+        yield ids
+
+
+score_game = seeded_row(Game, 'game_ids', 'score_game_id')
+time_game = seeded_row(Game, 'game_ids', 'time_game_id')
+team = seeded_row(Team, 'game_ids', 'team_id')
+tournament = seeded_row(Tournament, 'class_tournament', 'tournament_id')
+round_obj = seeded_row(Round, 'class_round', 'round_id')
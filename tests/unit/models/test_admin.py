@@ -33,6 +33,15 @@ class TestAdminModel:
         assert admin.passwordHash != 'mypassword'
         assert len(admin.passwordHash) > 20  # Hash should be long
 
+    def test_set_password_uses_configured_method(self, app, db_session):
+        """Test hashing follows PASSWORD_HASH_METHOD and still round-trips."""
+        admin = Admin(username='methoduser')
+        admin.setPassword('mypassword')
+
+        assert admin.passwordHash.startswith(app.config['PASSWORD_HASH_METHOD'] + '$')
+        assert admin.checkPassword('mypassword') is True
+        assert admin.checkPassword('otherpassword') is False
+
     def test_check_password_correct(self, admin_user):
         """Test password verification with correct password."""
         assert admin_user.checkPassword('testpassword123') is True
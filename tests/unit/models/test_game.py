@@ -55,7 +55,6 @@ class TestGameModel:
 
         db_session.add_all([score1, score2])
         db_session.commit()
-        db_session.refresh(game)
 
         assert game.scores.count() == 2
         assert score1 in game.scores.all()
@@ -68,7 +67,6 @@ class TestGameModel:
 
         db_session.add_all([penalty1, penalty2])
         db_session.commit()
-        db_session.refresh(game)
 
         assert game.penalties.count() == 2
 
@@ -104,7 +102,7 @@ class TestGameModel:
         db_session.commit()
 
         # Score should be deleted
-        assert db_session.query(Score).filter_by(id=score_id).first() is None
+        assert db_session.get(Score, score_id) is None
 
     def test_cascade_delete_penalties(self, db_session, game, teams):
         """Test that penalties are deleted when game is deleted."""
@@ -119,7 +117,7 @@ class TestGameModel:
         db_session.commit()
 
         # Penalty should be deleted
-        assert db_session.query(Penalty).filter_by(id=penalty_id).first() is None
+        assert db_session.get(Penalty, penalty_id) is None
 
     def test_sequence_number(self, db_session, game_night):
         """Test sequence_number for ordering games."""
@@ -137,24 +135,18 @@ class TestGameModel:
         assert games[1].name == 'Second Game'
         assert games[2].name == 'Third Game'
 
-    def test_metric_types(self, db_session, game_night):
-        """Test different metric types."""
-        score_game = Game(name='Score Game', game_night_id=game_night.id, metric_type='score')
-        time_game = Game(name='Time Game', game_night_id=game_night.id, metric_type='time')
+    @pytest.mark.parametrize('field,value', [
+        ('metric_type', 'score'),
+        ('metric_type', 'time'),
+        ('scoring_direction', 'lower_better'),
+        ('scoring_direction', 'higher_better'),
+    ])
+    def test_game_enum_fields(self, db_session, game_night, field, value):
+        """Test metric types and scoring directions round-trip."""
+        game = Game(name='Enum Game', game_night_id=game_night.id, **{field: value})
 
-        db_session.add_all([score_game, time_game])
-        db_session.commit()
-
-        assert score_game.metric_type == 'score'
-        assert time_game.metric_type == 'time'
-
-    def test_scoring_direction(self, db_session, game_night):
-        """Test different scoring directions."""
-        lower_better = Game(name='Golf', game_night_id=game_night.id, scoring_direction='lower_better')
-        higher_better = Game(name='Basketball', game_night_id=game_night.id, scoring_direction='higher_better')
-
-        db_session.add_all([lower_better, higher_better])
+        db_session.add(game)
         db_session.commit()
 
-        assert lower_better.scoring_direction == 'lower_better'
-        assert higher_better.scoring_direction == 'higher_better'
+        stored = db_session.query(getattr(Game, field)).filter_by(id=game.id).scalar()
+        assert stored == value
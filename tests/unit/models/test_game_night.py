@@ -52,7 +52,6 @@ class TestGameNightModel:
 
         db_session.add_all([game1, game2])
         db_session.commit()
-        db_session.refresh(game_night)
 
         assert game_night.total_games == 2
 
@@ -65,7 +64,6 @@ class TestGameNightModel:
 
         db_session.add_all([game1, game2, game3])
         db_session.commit()
-        db_session.refresh(game_night)
 
         assert game_night.total_games == 3
         assert game_night.completed_games == 2
@@ -93,7 +91,6 @@ class TestGameNightModel:
 
         db_session.add_all([score1, score2, score3])
         db_session.commit()
-        db_session.refresh(game_night)
 
         leaderboard = game_night.get_leaderboard()
 
@@ -116,7 +113,6 @@ class TestGameNightModel:
 
         db_session.add_all([score1, score2])
         db_session.commit()
-        db_session.refresh(game_night)
 
         winner = game_night.get_winner()
         assert winner.name == 'Winner'
@@ -132,7 +128,6 @@ class TestGameNightModel:
         db_session.commit()
 
         game_night.finalize()
-        db_session.refresh(game_night)
 
         assert game_night.is_completed is True
         assert game_night.is_active is False
@@ -115,4 +115,4 @@ class TestParticipantModel:
         db_session.commit()
 
         # Participant should be deleted
-        assert db_session.query(Participant).filter_by(id=participant_id).first() is None
+        assert db_session.get(Participant, participant_id) is None
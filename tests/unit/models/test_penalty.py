@@ -4,8 +4,8 @@ Test IDs: PEN-M-001 through PEN-M-010
 Coverage: Penalty model creation, unit property, stackable flag, relationships
 """
 import pytest
-from app.models import Penalty, Game
-from tests.factories import GameFactory, GameNightFactory, PenaltyFactory
+from app.models import Penalty
+from tests.factories import PenaltyFactory
 
 
 @pytest.mark.unit
@@ -13,15 +13,11 @@ from tests.factories import GameFactory, GameNightFactory, PenaltyFactory
 class TestPenaltyModel:
     """Test suite for Penalty model."""
 
-    def test_penalty_creation(self, db_session):
+    def test_penalty_creation(self, db_session, score_game):
         """PEN-M-001: Test creating penalty with all fields."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         # Act
         penalty = Penalty(
-            game_id=game.id,
+            game_id=score_game.id,
             name='Late Arrival',
             value=5,
             stackable=True
@@ -31,62 +27,34 @@ class TestPenaltyModel:
 
         # Assert
         assert penalty.id is not None
-        assert penalty.game_id == game.id
+        assert penalty.game_id == score_game.id
         assert penalty.name == 'Late Arrival'
         assert penalty.value == 5
         assert penalty.stackable is True
 
-    def test_penalty_unit_property_score(self, db_session):
-        """PEN-M-002: Test unit='points' for score games."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(
-            db_session,
-            game_night_id=game_night.id,
-            metric_type='score'
-        )
-
+    @pytest.mark.parametrize('metric_type,expected_unit', [
+        ('score', 'points'),
+        ('time', 'seconds'),
+    ])
+    @pytest.mark.usefixtures('commit_once')
+    def test_penalty_unit_property(self, db_session, game_ids, metric_type, expected_unit):
+        """PEN-M-002, PEN-M-003: Test unit matches the game's metric type."""
         # Act
         penalty = PenaltyFactory.create(
             db_session,
-            game_id=game.id,
-            name='Point Penalty',
+            game_id=getattr(game_ids, f'{metric_type}_game_id'),
+            name='Unit Penalty',
             value=10
         )
 
         # Assert
-        assert penalty.unit == 'points'
-
-    def test_penalty_unit_property_time(self, db_session):
-        """PEN-M-003: Test unit='seconds' for time games."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(
-            db_session,
-            game_night_id=game_night.id,
-            metric_type='time'
-        )
-
-        # Act
-        penalty = PenaltyFactory.create(
-            db_session,
-            game_id=game.id,
-            name='Time Penalty',
-            value=30
-        )
-
-        # Assert
-        assert penalty.unit == 'seconds'
+        assert penalty.unit == expected_unit
 
-    def test_penalty_stackable_true(self, db_session):
+    def test_penalty_stackable_true(self, db_session, score_game):
         """PEN-M-004: Test stackable penalty can be applied multiple times."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         # Act
         penalty = Penalty(
-            game_id=game.id,
+            game_id=score_game.id,
             name='Multiple Infractions',
             value=3,
             stackable=True
@@ -97,15 +65,11 @@ class TestPenaltyModel:
         # Assert
         assert penalty.stackable is True
 
-    def test_penalty_stackable_false(self, db_session):
+    def test_penalty_stackable_false(self, db_session, score_game):
         """PEN-M-005: Test non-stackable penalty."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         # Act
         penalty = Penalty(
-            game_id=game.id,
+            game_id=score_game.id,
             name='One-time Penalty',
             value=10,
             stackable=False
@@ -116,53 +80,44 @@ class TestPenaltyModel:
         # Assert
         assert penalty.stackable is False
 
-    def test_penalty_game_relationship(self, db_session):
+    @pytest.mark.usefixtures('commit_once')
+    def test_penalty_game_relationship(self, db_session, score_game):
         """PEN-M-006: Test penalty belongs to game."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         # Act
         penalty = PenaltyFactory.create(
             db_session,
-            game_id=game.id,
+            game_id=score_game.id,
             name='Test Penalty'
         )
 
         # Assert
         assert penalty.game is not None
-        assert penalty.game.id == game.id
-        assert penalty.game.name == game.name
+        assert penalty.game.id == score_game.id
+        assert penalty.game.name == score_game.name
 
-    def test_penalty_cascade_delete(self, db_session):
+    @pytest.mark.usefixtures('commit_once')
+    def test_penalty_cascade_delete(self, db_session, score_game):
         """PEN-M-007: Test penalty deleted when game deleted."""
         # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         penalty = PenaltyFactory.create(
             db_session,
-            game_id=game.id,
+            game_id=score_game.id,
             name='Test Penalty'
         )
         penalty_id = penalty.id
 
         # Act - Delete game
-        db_session.delete(game)
+        db_session.delete(score_game)
         db_session.commit()
 
         # Assert - Penalty should be deleted
         assert db_session.query(Penalty).filter_by(id=penalty_id).first() is None
 
-    def test_penalty_negative_value(self, db_session):
+    def test_penalty_negative_value(self, db_session, score_game):
         """PEN-M-008: Test negative penalty values (bonuses)."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         # Act
         penalty = Penalty(
-            game_id=game.id,
+            game_id=score_game.id,
             name='Bonus Points',
             value=-10,  # Negative value
             stackable=False
@@ -173,15 +128,11 @@ class TestPenaltyModel:
         # Assert
         assert penalty.value == -10
 
-    def test_penalty_zero_value(self, db_session):
+    def test_penalty_zero_value(self, db_session, score_game):
         """PEN-M-009: Test zero value penalty (edge case)."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         # Act
         penalty = Penalty(
-            game_id=game.id,
+            game_id=score_game.id,
             name='Warning Only',
             value=0,
             stackable=False
@@ -192,15 +143,11 @@ class TestPenaltyModel:
         # Assert
         assert penalty.value == 0
 
-    def test_penalty_large_value(self, db_session):
+    def test_penalty_large_value(self, db_session, score_game):
         """PEN-M-010: Test large penalty values."""
-        # Arrange
-        game_night = GameNightFactory.create(db_session)
-        game = GameFactory.create(db_session, game_night_id=game_night.id)
-
         # Act
         penalty = Penalty(
-            game_id=game.id,
+            game_id=score_game.id,
             name='Major Violation',
             value=1000,
             stackable=False
@@ -1,6 +1,7 @@
 """Unit tests for Round model."""
 import pytest
 from app.models import Round
+from tests.factories import bulk_insert
 
 
 @pytest.mark.unit
@@ -59,60 +60,48 @@ class TestRoundModel:
 
     def test_multiple_rounds_for_game(self, db_session, game):
         """Test creating multiple rounds for a single game."""
-        rounds = []
-        for i in range(1, 4):
-            round_obj = Round(
-                game_id=game.id,
-                round_number=i,
-                description=f'Round {i}'
-            )
-            db_session.add(round_obj)
-            rounds.append(round_obj)
-
-        db_session.commit()
+        round_ids = bulk_insert(db_session, Round, [
+            {'game_id': game.id, 'round_number': i, 'description': f'Round {i}'}
+            for i in range(1, 4)
+        ])
 
         # Verify all rounds created
-        assert all(r.id is not None for r in rounds)
+        assert all(round_id is not None for round_id in round_ids)
 
         # Verify game has all rounds
         game_rounds = game.rounds.order_by(Round.round_number).all()
         assert len(game_rounds) == 3
         assert [r.round_number for r in game_rounds] == [1, 2, 3]
 
-    def test_round_name_property(self, db_session, game):
+    def test_round_name_property(self):
         """Test the name property of round."""
         # Round with description
         round1 = Round(
-            game_id=game.id,
+            game_id=1,
             round_number=1,
             description='Opening Round'
         )
-        db_session.add(round1)
 
         # Round without description
         round2 = Round(
-            game_id=game.id,
+            game_id=1,
             round_number=2
         )
-        db_session.add(round2)
-        db_session.commit()
 
         assert round1.name == 'Round 1: Opening Round'
         assert round2.name == 'Round 2'
 
-    def test_round_repr(self, db_session, game):
+    def test_round_repr(self):
         """Test string representation of round."""
         round_obj = Round(
-            game_id=game.id,
+            game_id=7,
             round_number=1
         )
-        db_session.add(round_obj)
-        db_session.commit()
 
         repr_str = repr(round_obj)
         assert 'Round' in repr_str
         assert str(round_obj.round_number) in repr_str
-        assert str(game.id) in repr_str
+        assert 'Game 7' in repr_str
 
     def test_round_cascade_delete(self, db_session, game):
         """Test that deleting a game cascades to rounds."""
@@ -130,19 +119,14 @@ class TestRoundModel:
         db_session.commit()
 
         # Verify round is also deleted
-        assert Round.query.get(round_id) is None
+        assert db_session.get(Round, round_id) is None
 
     def test_round_index(self, db_session, game):
         """Test that composite index works for game_id and round_number."""
         # Create multiple rounds
-        for i in range(1, 6):
-            round_obj = Round(
-                game_id=game.id,
-                round_number=i
-            )
-            db_session.add(round_obj)
-
-        db_session.commit()
+        bulk_insert(db_session, Round, [
+            {'game_id': game.id, 'round_number': i} for i in range(1, 6)
+        ])
 
         # Query using the indexed fields
         round_3 = Round.query.filter_by(
@@ -1,6 +1,8 @@
 """Unit tests for RoundScore model."""
 import pytest
-from app.models import Round, RoundScore
+from sqlalchemy.exc import IntegrityError
+from app.models import RoundScore, Team
+from tests.utils import assert_num_queries, load_strict
 
 
 @pytest.mark.unit
@@ -8,16 +10,8 @@ from app.models import Round, RoundScore
 class TestRoundScoreModel:
     """Test suite for RoundScore model."""
 
-    def test_create_round_score(self, db_session, game, teams):
+    def test_create_round_score(self, db_session, round_obj, teams):
         """Test creating a round score."""
-        # Create a round first
-        round_obj = Round(
-            game_id=game.id,
-            round_number=1
-        )
-        db_session.add(round_obj)
-        db_session.commit()
-
         # Create round score
         round_score = RoundScore(
             round_id=round_obj.id,
@@ -36,12 +30,8 @@ class TestRoundScoreModel:
         assert round_score.points == 10
         assert round_score.notes == 'Great performance'
 
-    def test_round_score_default_values(self, db_session, game, teams):
+    def test_round_score_default_values(self, db_session, round_obj, teams):
         """Test default values for round score."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         round_score = RoundScore(
             round_id=round_obj.id,
             team_id=teams[0].id
@@ -55,12 +45,8 @@ class TestRoundScoreModel:
         assert round_score.multi_timer_avg is None
         assert round_score.timer_count == 0
 
-    def test_round_score_round_relationship(self, db_session, game, teams):
+    def test_round_score_round_relationship(self, db_session, round_obj, teams):
         """Test relationship between round score and round."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         round_score = RoundScore(
             round_id=round_obj.id,
             team_id=teams[0].id,
@@ -68,23 +54,20 @@ class TestRoundScoreModel:
         )
         db_session.add(round_score)
         db_session.commit()
+        round_score = load_strict(db_session, RoundScore, round_score.id, RoundScore.round)
 
         # Test forward relationship
         assert round_score.round is not None
         assert round_score.round.id == round_obj.id
 
-        # Test back relationship
-        db_session.refresh(round_obj)
-        round_scores_list = list(round_obj.round_scores)
+        # Test back relationship (dynamic, so it always queries once)
+        with assert_num_queries(db_session, 1):
+            round_scores_list = list(round_obj.round_scores)
         assert len(round_scores_list) > 0
         assert round_scores_list[0].id == round_score.id
 
-    def test_round_score_team_relationship(self, db_session, game, teams):
+    def test_round_score_team_relationship(self, db_session, round_obj, teams):
         """Test relationship between round score and team."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         round_score = RoundScore(
             round_id=round_obj.id,
             team_id=teams[0].id,
@@ -92,21 +75,18 @@ class TestRoundScoreModel:
         )
         db_session.add(round_score)
         db_session.commit()
+        round_score = load_strict(db_session, RoundScore, round_score.id, RoundScore.team)
+        team = load_strict(db_session, Team, teams[0].id, Team.round_scores)
 
         # Test forward relationship
         assert round_score.team is not None
-        assert round_score.team.id == teams[0].id
+        assert round_score.team.id == team.id
 
-        # Test back relationship
-        assert len(teams[0].round_scores) > 0
-        assert teams[0].round_scores[0].id == round_score.id
+        # Test back relationship (the team is fresh, so this is its only score)
+        assert [rs.id for rs in team.round_scores] == [round_score.id]
 
-    def test_unique_constraint_round_team(self, db_session, game, teams):
+    def test_unique_constraint_round_team(self, db_session, round_obj, teams):
         """Test unique constraint on round_id and team_id."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         # First round score
         round_score1 = RoundScore(
             round_id=round_obj.id,
@@ -114,7 +94,7 @@ class TestRoundScoreModel:
             points=5
         )
         db_session.add(round_score1)
-        db_session.commit()
+        db_session.flush()
 
         # Try to create duplicate
         round_score2 = RoundScore(
@@ -124,41 +104,28 @@ class TestRoundScoreModel:
         )
         db_session.add(round_score2)
 
-        # Should raise IntegrityError
-        with pytest.raises(Exception):  # SQLAlchemy will raise IntegrityError
-            db_session.commit()
+        # Flushing is enough to hit the constraint
+        with pytest.raises(IntegrityError):
+            db_session.flush()
 
         db_session.rollback()
 
-    def test_multiple_teams_same_round(self, db_session, game, teams):
+    def test_multiple_teams_same_round(self, db_session, round_obj, teams):
         """Test multiple teams can have scores in the same round."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         # Create scores for multiple teams
-        scores = []
-        for i, team in enumerate(teams[:3]):
-            score = RoundScore(
-                round_id=round_obj.id,
-                team_id=team.id,
-                points=10 - i
-            )
-            db_session.add(score)
-            scores.append(score)
-
+        scores = [
+            RoundScore(round_id=round_obj.id, team_id=team.id, points=10 - i)
+            for i, team in enumerate(teams[:3])
+        ]
+        db_session.add_all(scores)
         db_session.commit()
 
         # Verify all scores created
         assert all(s.id is not None for s in scores)
         assert len(round_obj.round_scores.all()) == 3
 
-    def test_round_score_repr(self, db_session, game, teams):
+    def test_round_score_repr(self, db_session, round_obj, teams):
         """Test string representation of round score."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         round_score = RoundScore(
             round_id=round_obj.id,
             team_id=teams[0].id,
@@ -173,12 +140,8 @@ class TestRoundScoreModel:
         assert str(teams[0].id) in repr_str
         assert '8' in repr_str
 
-    def test_round_score_cascade_delete_from_round(self, db_session, game, teams):
+    def test_round_score_cascade_delete_from_round(self, db_session, round_obj, teams):
         """Test that deleting a round cascades to round scores."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         round_score = RoundScore(
             round_id=round_obj.id,
             team_id=teams[0].id,
@@ -194,14 +157,10 @@ class TestRoundScoreModel:
         db_session.commit()
 
         # Verify round score is also deleted
-        assert RoundScore.query.get(score_id) is None
+        assert db_session.get(RoundScore, score_id) is None
 
-    def test_multi_timer_fields(self, db_session, game, teams):
+    def test_multi_timer_fields(self, db_session, round_obj, teams):
         """Test multi-timer support fields."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         round_score = RoundScore(
             round_id=round_obj.id,
             team_id=teams[0].id,
@@ -216,21 +175,13 @@ class TestRoundScoreModel:
         assert round_score.multi_timer_avg == 121.3
         assert round_score.timer_count == 3
 
-    def test_round_score_index(self, db_session, game, teams):
+    def test_round_score_index(self, db_session, round_obj, teams):
         """Test that composite index works for round_id and team_id."""
-        round_obj = Round(game_id=game.id, round_number=1)
-        db_session.add(round_obj)
-        db_session.commit()
-
         # Create multiple round scores
-        for team in teams[:3]:
-            score = RoundScore(
-                round_id=round_obj.id,
-                team_id=team.id,
-                points=5
-            )
-            db_session.add(score)
-
+        db_session.add_all([
+            RoundScore(round_id=round_obj.id, team_id=team.id, points=5)
+            for team in teams[:3]
+        ])
         db_session.commit()
 
         # Query using the indexed fields
@@ -1,6 +1,8 @@
 """Unit tests for Team model."""
 import pytest
 from app.models import Team, Score, Participant
+from tests.factories import bulk_insert
+from tests.utils import load_strict
 
 
 @pytest.mark.unit
@@ -43,16 +45,12 @@ class TestTeamModel:
         team = teams[0]
 
         # Add multiple scores
-        score1 = Score(game_id=game.id, team_id=team.id, score_value=100, points=10)
-        score2 = Score(game_id=game.id, team_id=team.id, score_value=90, points=8)
-        score3 = Score(game_id=game.id, team_id=team.id, score_value=80, points=6)
-
-        db_session.add_all([score1, score2, score3])
-        db_session.commit()
-
-        # Refresh to get updated relationships
-        db_session.refresh(team)
+        bulk_insert(db_session, Score, [
+            {'game_id': game.id, 'team_id': team.id, 'score_value': value, 'points': points}
+            for value, points in [(100, 10), (90, 8), (80, 6)]
+        ])
 
+        # team.scores was never loaded, so this first access reads all three
         assert team.totalPoints == 24  # 10 + 8 + 6
 
     def test_games_played(self, db_session, teams, game):
@@ -63,12 +61,13 @@ class TestTeamModel:
         assert team.games_played == 0
 
         # Add scores for 3 games
-        for i in range(3):
-            score = Score(game_id=game.id, team_id=team.id, score_value=100, points=10)
-            db_session.add(score)
-
+        db_session.add_all([
+            Score(game_id=game.id, team_id=team.id, score_value=100, points=10)
+            for _ in range(3)
+        ])
         db_session.commit()
-        db_session.refresh(team)
+        # Only the scores collection is stale; reload just that
+        db_session.expire(team, ['scores'])
 
         assert team.games_played == 3
 
@@ -82,9 +81,9 @@ class TestTeamModel:
         assert team.game_night == game_night
         assert team in game_night.teams.all()
 
-    def test_team_participants_relationship(self, teams, participants):
+    def test_team_participants_relationship(self, db_session, teams, participants):
         """Test relationship with participants."""
-        team = teams[0]
+        team = load_strict(db_session, Team, teams[0].id, Team.participants)
 
         team_participants = list(team.participants)
         assert len(team_participants) == 2  # From fixture
@@ -111,7 +110,7 @@ class TestTeamModel:
         # Add score
         score = Score(game_id=game.id, team_id=team.id, score_value=100, points=10)
         db_session.add(score)
-        db_session.commit()
+        db_session.flush()
 
         score_id = score.id
 
@@ -120,4 +119,4 @@ class TestTeamModel:
         db_session.commit()
 
         # Score should be deleted
-        assert db_session.query(Score).filter_by(id=score_id).first() is None
+        assert db_session.get(Score, score_id) is None
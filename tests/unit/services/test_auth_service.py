@@ -124,28 +124,33 @@ class TestAuthService:
         admin.setPassword('mypassword')
 
         db_session.add(admin)
-        db_session.commit()
+        db_session.flush()
 
         # Hash should not equal plain password
         assert admin.passwordHash != 'mypassword'
 
-        # Hash should be long (bcrypt hashes are ~60 chars)
+        # Hash should be long (method, salt and hex digest)
         assert len(admin.passwordHash) > 50
 
         # Same password should produce different hashes (due to salt)
         admin2 = Admin(username='securitytest2')
         admin2.setPassword('mypassword')
         db_session.add(admin2)
-        db_session.commit()
+        db_session.flush()
 
         assert admin.passwordHash != admin2.passwordHash
 
-    def test_multiple_failed_authentications(self, db_session, admin_user):
-        """Test multiple failed authentication attempts."""
-        # Simulate brute force attempts
-        for _ in range(5):
-            result = AuthService.authenticate(admin_user.username, 'wrongpassword')
-            assert result is None
+    @pytest.mark.parametrize('wrong_password', [
+        'wrongpassword',
+        'testpassword12',
+        'testpassword1234',
+        'TESTPASSWORD123',
+        ' testpassword123',
+    ])
+    def test_failed_authentication(self, db_session, admin_user, wrong_password):
+        """Test that brute force guesses fail without locking the account."""
+        result = AuthService.authenticate(admin_user.username, wrong_password)
+        assert result is None
 
         # Account should still work with correct password
         result = AuthService.authenticate(admin_user.username, 'testpassword123')
@@ -1,8 +1,47 @@
 """Unit tests for GameNightService."""
 import pytest
 from datetime import date, timedelta
+from types import SimpleNamespace
+from werkzeug.exceptions import NotFound
 from app.services.game_night_service import GameNightService
 from app.models import GameNight, Team, Game, Participant
+from tests.factories import GameFactory, GameNightFactory, TeamFactory, bulk_insert
+from tests.utils import seeded_savepoint, single_commit
+
+
+def _bulk_create_nights(db_session, specs):
+    """Insert one game night per spec dict in one statement and return their ids.
+
+    Specs only need the columns a test cares about; name, date and
+    is_completed are filled in so every row has the same keys.
+    """
+    return bulk_insert(db_session, GameNight, [
+        {'name': f'Night {i}', 'date': date.today(), 'is_completed': False, **spec}
+        for i, spec in enumerate(specs, start=1)
+    ])
+
+
+def _seed_nights(session):
+    """Insert two inactive game nights, each with two teams and one game."""
+    with single_commit(session):
+        nights = []
+        for name in ('Night 1', 'Night 2'):
+            game_night = GameNightFactory.create(
+                session, name=name, is_active=False, is_working_context=False
+            )
+            TeamFactory.create_batch(session, count=2, game_night_id=game_night.id,
+                                     participant_count=1)
+            game = GameFactory.create(session, game_night_id=game_night.id)
+            nights.append((game_night, game))
+    (gn1, gn1_game), (gn2, _) = nights
+    return SimpleNamespace(gn1_id=gn1.id, gn1_game_id=gn1_game.id, gn2_id=gn2.id)
+
+
+@pytest.fixture(scope='class')
+def populated_nights(app, db_connection):
+    """Seed two inactive game nights that are ready to activate."""
+    with seeded_savepoint(app, db_connection, _seed_nights) as ids:
+        yield ids
 
 
 class TestGameNightService:
@@ -37,168 +76,43 @@ class TestGameNightService:
 
         assert game_night.date == date(2024, 12, 25)
 
-    def test_set_active_game_night(self, db_session):
-        """Test setting a game night as active."""
-        from app.services.team_service import TeamService
-        from app.services.game_service import GameService
-
-        # Create multiple game nights
-        gn1 = GameNightService.create_game_night('Night 1', date.today())
-        gn2 = GameNightService.create_game_night('Night 2', date.today())
-        gn3 = GameNightService.create_game_night('Night 3', date.today())
-
-        # Set gn2 as working context and add required teams and games
-        GameNightService.set_working_context(gn2.id)
-        TeamService.create_team('Team A', [{'firstName': 'A', 'lastName': 'Player'}], '#FF0000')
-        TeamService.create_team('Team B', [{'firstName': 'B', 'lastName': 'Player'}], '#00FF00')
-        GameService.create_game({
-            'name': 'Test Game',
-            'type': 'trivia',
-            'sequence_number': 1,
-            'point_scheme': 1,
-            'metric_type': 'score',
-            'scoring_direction': 'higher_better',
-            'public_input': False
-        }, [])
-
-        # Activate gn2
-        active_gn = GameNightService.set_active_game_night(gn2.id)
-
-        assert active_gn.id == gn2.id
-        assert active_gn.is_active is True
-
-        # Verify others are inactive
-        db_session.refresh(gn1)
-        db_session.refresh(gn3)
-        assert gn1.is_active is False
-        assert gn3.is_active is False
-
-    def test_set_active_game_night_deactivates_previous(self, db_session):
-        """Test that setting active deactivates previous active."""
-        from app.services.team_service import TeamService
-        from app.services.game_service import GameService
-
-        gn1 = GameNightService.create_game_night('Night 1', date.today())
-        gn2 = GameNightService.create_game_night('Night 2', date.today())
-
-        # Setup gn1 with teams and games
-        GameNightService.set_working_context(gn1.id)
-        TeamService.create_team('Team A', [{'firstName': 'A', 'lastName': 'Player'}], '#FF0000')
-        TeamService.create_team('Team B', [{'firstName': 'B', 'lastName': 'Player'}], '#00FF00')
-        GameService.create_game({
-            'name': 'Test Game',
-            'type': 'trivia',
-            'sequence_number': 1,
-            'point_scheme': 1,
-            'metric_type': 'score',
-            'scoring_direction': 'higher_better',
-            'public_input': False
-        }, [])
-
-        # Activate gn1
-        GameNightService.set_active_game_night(gn1.id)
-        assert gn1.is_active is True
-
-        # Mark gn1's game as complete before switching
-        from app.models import Game
-        game1 = Game.query.filter_by(name='Test Game').first()
-        game1.isCompleted = True
-        db_session.commit()
-
-        # Setup gn2 with teams and games
-        GameNightService.set_working_context(gn2.id)
-        TeamService.create_team('Team C', [{'firstName': 'C', 'lastName': 'Player'}], '#0000FF')
-        TeamService.create_team('Team D', [{'firstName': 'D', 'lastName': 'Player'}], '#FFFF00')
-        GameService.create_game({
-            'name': 'Test Game 2',
-            'type': 'trivia',
-            'sequence_number': 1,
-            'point_scheme': 1,
-            'metric_type': 'score',
-            'scoring_direction': 'higher_better',
-            'public_input': False
-        }, [])
-
-        # Activate gn2
-        GameNightService.set_active_game_night(gn2.id)
-
-        # Verify gn1 is now inactive
-        db_session.refresh(gn1)
-        assert gn1.is_active is False
-        assert gn2.is_active is True
-
-    def test_get_active_game_night(self, db_session):
-        """Test getting the active game night."""
-        from app.services.team_service import TeamService
-        from app.services.game_service import GameService
-
-        gn1 = GameNightService.create_game_night('Night 1', date.today())
-        gn2 = GameNightService.create_game_night('Night 2', date.today())
-
-        # No active game night initially
-        active = GameNightService.get_active_game_night()
-        assert active is None
-
-        # Setup gn2 with teams and games
-        GameNightService.set_working_context(gn2.id)
-        TeamService.create_team('Team A', [{'firstName': 'A', 'lastName': 'Player'}], '#FF0000')
-        TeamService.create_team('Team B', [{'firstName': 'B', 'lastName': 'Player'}], '#00FF00')
-        GameService.create_game({
-            'name': 'Test Game',
-            'type': 'trivia',
-            'sequence_number': 1,
-            'point_scheme': 1,
-            'metric_type': 'score',
-            'scoring_direction': 'higher_better',
-            'public_input': False
-        }, [])
-
-        # Set gn2 as active
-        GameNightService.set_active_game_night(gn2.id)
-
-        # Get active
-        active = GameNightService.get_active_game_night()
-        assert active is not None
-        assert active.id == gn2.id
-
     def test_get_all_game_nights_desc(self, db_session):
         """Test getting all game nights in descending order."""
-        gn1 = GameNightService.create_game_night('Night 1', date.today() - timedelta(days=2))
-        gn2 = GameNightService.create_game_night('Night 2', date.today())
-        gn3 = GameNightService.create_game_night('Night 3', date.today() - timedelta(days=1))
+        gn1_id, gn2_id, gn3_id = _bulk_create_nights(db_session, [
+            {'date': date.today() - timedelta(days=2)},
+            {'date': date.today()},
+            {'date': date.today() - timedelta(days=1)},
+        ])
 
         game_nights = GameNightService.get_all_game_nights(order='desc')
 
         # Should be ordered newest to oldest
-        assert game_nights[0].id == gn2.id
-        assert game_nights[1].id == gn3.id
-        assert game_nights[2].id == gn1.id
+        assert [gn.id for gn in game_nights] == [gn2_id, gn3_id, gn1_id]
 
     def test_get_all_game_nights_asc(self, db_session):
         """Test getting all game nights in ascending order."""
-        gn1 = GameNightService.create_game_night('Night 1', date.today() - timedelta(days=2))
-        gn2 = GameNightService.create_game_night('Night 2', date.today())
-        gn3 = GameNightService.create_game_night('Night 3', date.today() - timedelta(days=1))
+        gn1_id, gn2_id, gn3_id = _bulk_create_nights(db_session, [
+            {'date': date.today() - timedelta(days=2)},
+            {'date': date.today()},
+            {'date': date.today() - timedelta(days=1)},
+        ])
 
         game_nights = GameNightService.get_all_game_nights(order='asc')
 
         # Should be ordered oldest to newest
-        assert game_nights[0].id == gn1.id
-        assert game_nights[1].id == gn3.id
-        assert game_nights[2].id == gn2.id
+        assert [gn.id for gn in game_nights] == [gn1_id, gn3_id, gn2_id]
 
     def test_get_completed_game_nights(self, db_session):
         """Test getting only completed game nights."""
-        gn1 = GameNightService.create_game_night('Completed 1', date.today())
-        gn1.is_completed = True
-        gn2 = GameNightService.create_game_night('Not Completed', date.today())
-        gn3 = GameNightService.create_game_night('Completed 2', date.today())
-        gn3.is_completed = True
-        db_session.commit()
+        night_ids = _bulk_create_nights(db_session, [
+            {'name': 'Completed 1', 'is_completed': True},
+            {'name': 'Not Completed'},
+            {'name': 'Completed 2', 'is_completed': True},
+        ])
 
         completed = GameNightService.get_completed_game_nights()
 
-        assert len(completed) == 2
+        assert {gn.id for gn in completed} == {night_ids[0], night_ids[2]}
         assert all(gn.is_completed for gn in completed)
 
     def test_get_game_night_by_id(self, db_session, game_night):
@@ -209,7 +123,7 @@ class TestGameNightService:
 
     def test_get_game_night_by_id_not_found(self, db_session):
         """Test getting non-existent game night raises 404."""
-        with pytest.raises(Exception):
+        with pytest.raises(NotFound):
             GameNightService.get_game_night_by_id(99999)
 
     def test_get_game_night_details(self, db_session, game_night, teams, game):
@@ -227,7 +141,7 @@ class TestGameNightService:
         """Test ending a game night."""
         # Mark as active first
         game_night.is_active = True
-        db_session.commit()
+        db_session.flush()
 
         ended_gn = GameNightService.end_game_night(game_night.id)
 
@@ -237,19 +151,11 @@ class TestGameNightService:
 
     def test_wipe_game_night_data(self, db_session, game_night):
         """Test wiping game night data."""
-        # Create teams and games
+        # Create teams with participants and a game, written in one flush
         team1 = Team(name='Team 1', color='#FF0000', game_night_id=game_night.id)
         team2 = Team(name='Team 2', color='#00FF00', game_night_id=game_night.id)
-        db_session.add_all([team1, team2])
-        db_session.commit()
-
-        # Add participants
-        p1 = Participant(firstName='John', lastName='Doe', team_id=team1.id)
-        p2 = Participant(firstName='Jane', lastName='Smith', team_id=team2.id)
-        db_session.add_all([p1, p2])
-        db_session.commit()
-
-        # Add game
+        team1.participants.append(Participant(firstName='John', lastName='Doe'))
+        team2.participants.append(Participant(firstName='Jane', lastName='Smith'))
         game = Game(
             name='Test Game',
             type='standard',
@@ -259,8 +165,8 @@ class TestGameNightService:
             metric_type='score',
             scoring_direction='higher_better'
         )
-        db_session.add(game)
-        db_session.commit()
+        db_session.add_all([team1, team2, game])
+        db_session.flush()
 
         # Verify data exists
         assert len(Team.query.filter_by(game_night_id=game_night.id).all()) == 2
@@ -306,7 +212,7 @@ class TestGameNightService:
 
     def test_delete_game_night_not_found(self, db_session):
         """Test deleting non-existent game night raises 404."""
-        with pytest.raises(Exception):
+        with pytest.raises(NotFound):
             GameNightService.delete_game_night(99999)
 
     def test_update_game_night(self, db_session, game_night):
@@ -333,3 +239,44 @@ class TestGameNightService:
 
         assert updated_gn.name == 'New Name Only'
         assert updated_gn.date == original_date
+
+
+class TestGameNightActivation:
+    """Test activating game nights that already have teams and games."""
+
+    def test_set_active_game_night(self, db_session, populated_nights):
+        """Test setting a game night as active."""
+        active_gn = GameNightService.set_active_game_night(populated_nights.gn2_id)
+
+        assert active_gn.id == populated_nights.gn2_id
+        assert active_gn.is_active is True
+
+        # Verify the other night is inactive
+        assert db_session.get(GameNight, populated_nights.gn1_id).is_active is False
+
+    def test_set_active_game_night_deactivates_previous(self, db_session, populated_nights):
+        """Test that setting active deactivates previous active."""
+        gn1 = GameNightService.set_active_game_night(populated_nights.gn1_id)
+        assert gn1.is_active is True
+
+        # Mark gn1's game as complete before switching
+        db_session.get(Game, populated_nights.gn1_game_id).isCompleted = True
+        db_session.flush()
+
+        gn2 = GameNightService.set_active_game_night(populated_nights.gn2_id)
+
+        # Verify gn1 is now inactive
+        assert gn1.is_active is False
+        assert gn2.is_active is True
+
+    def test_get_active_game_night(self, db_session, populated_nights):
+        """Test getting the active game night."""
+        # No active game night initially
+        active = GameNightService.get_active_game_night()
+        assert active is None
+
+        GameNightService.set_active_game_night(populated_nights.gn2_id)
+
+        active = GameNightService.get_active_game_night()
+        assert active is not None
+        assert active.id == populated_nights.gn2_id
@@ -1,35 +1,112 @@
 """Unit tests for GameService."""
 import pytest
+from types import MappingProxyType, SimpleNamespace
+from sqlalchemy import func, select
+from werkzeug.exceptions import NotFound
 from app.services.game_service import GameService
-from app.models import Game, Score, Penalty, Tournament, Match, Team
+from app.models import Game, GameNight, Score, Penalty, Tournament, Match, Team
+from tests.factories import GameNightFactory, TeamFactory, bulk_insert
+from tests.utils import assert_num_queries, seeded_row, seeded_rows, seeded_savepoint, single_commit
+
+
+# Valid GameService form data; tests copy it and override what they need
+BASE_FORM = MappingProxyType({
+    'type': 'standard',
+    'sequence_number': 1,
+    'point_scheme': 1,
+    'metric_type': 'score',
+    'scoring_direction': 'higher_better',
+    'public_input': False,
+})
+
+# Column values for games inserted directly; the form fields map onto
+# Game columns one to one
+_GAME_DEFAULTS = {**BASE_FORM, 'isCompleted': False}
+
+
+def _bulk_create_games(db_session, game_night_id, specs):
+    """Insert one game per spec dict in one statement and return their ids.
+
+    Specs only need the columns a test cares about; the rest come from
+    _GAME_DEFAULTS so every row has the same keys.
+    """
+    return bulk_insert(db_session, Game, [
+        {**_GAME_DEFAULTS, 'game_night_id': game_night_id, **spec}
+        for spec in specs
+    ])
+
+
+def _load_games(db_session, game_ids):
+    """Load games with one IN query, returned in the order of game_ids."""
+    games = db_session.scalars(select(Game).where(Game.id.in_(game_ids)))
+    by_id = {game.id: game for game in games}
+    return [by_id[game_id] for game_id in game_ids]
+
+
+def _count(db_session, column, value):
+    """Count the rows whose column equals value without loading them."""
+    return db_session.scalar(
+        select(func.count()).select_from(column.table).where(column == value)
+    )
+
+
+def _seed_game_night(session):
+    """Insert a game night with three teams and no games.
+
+    Games are left to the tests, since several of them count every game
+    in the database.
+    """
+    with single_commit(session):
+        game_night = GameNightFactory.create(session)
+        teams = TeamFactory.create_batch(session, count=3, game_night_id=game_night.id,
+                                         participant_count=0)
+    return SimpleNamespace(
+        game_night_id=game_night.id,
+        team_ids=[team.id for team in teams]
+    )
+
+
+@pytest.fixture(scope='class')
+def class_game_night(app, db_connection):
+    """Seed a game night with three teams for a whole test class."""
+    with seeded_savepoint(app, db_connection, _seed_game_night) as ids:
+        yield ids
+
+
+@pytest.fixture
+def game_night_id(class_game_night):
+    """Id of the class's seeded game night, for tests that don't need the row."""
+    return class_game_night.game_night_id
+
+
+game_night = seeded_row(GameNight, 'class_game_night', 'game_night_id')
+teams = seeded_rows(Team, 'class_game_night', 'team_ids')
 
 
 class TestGameService:
     """Test game service operations."""
 
+    @pytest.mark.usefixtures('strict_loading')
     def test_get_all_games(self, db_session, game):
         """Test getting all games."""
         result = GameService.get_all_games(ordered=False)
         assert len(result) >= 1
-        assert any(g.id == game.id for g in result)
+        assert game.id in {g.id for g in result}
 
-    def test_get_all_games_ordered(self, db_session, game_night):
+    @pytest.mark.usefixtures('strict_loading')
+    def test_get_all_games_ordered(self, db_session, game_night_id):
         """Test getting games ordered by sequence."""
         # Create multiple games with different sequences
-        game1 = Game(name='Game 1', type='standard', sequence_number=3,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        game2 = Game(name='Game 2', type='standard', sequence_number=1,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        game3 = Game(name='Game 3', type='standard', sequence_number=2,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        db_session.add_all([game1, game2, game3])
-        db_session.commit()
-
-        result = GameService.get_all_games(ordered=True)
-        sequences = [g.sequence_number for g in result]
+        _bulk_create_games(db_session, game_night_id, [
+            {'name': 'Game 1', 'sequence_number': 3},
+            {'name': 'Game 2', 'sequence_number': 1},
+            {'name': 'Game 3', 'sequence_number': 2},
+        ])
+
+        # Reading the games must not trigger per-game lazy loads
+        with assert_num_queries(db_session, 1):
+            result = GameService.get_all_games(ordered=True)
+            sequences = [g.sequence_number for g in result]
         assert sequences == sorted(sequences)
 
     def test_get_game_by_id(self, db_session, game):
@@ -40,39 +117,28 @@ class TestGameService:
 
     def test_get_game_by_id_not_found(self, db_session):
         """Test getting non-existent game raises 404."""
-        with pytest.raises(Exception):
+        with pytest.raises(NotFound):
             GameService.get_game_by_id(99999)
 
-    def test_create_game(self, db_session, game_night):
+    def test_create_game(self, db_session, game_night_id):
         """Test creating a new game."""
-        form_data = {
-            'name': 'New Game',
-            'type': 'standard',
-            'sequence_number': 1,
-            'point_scheme': 1,
-            'metric_type': 'score',
-            'scoring_direction': 'higher_better',
-            'public_input': False
-        }
+        form_data = {**BASE_FORM, 'name': 'New Game'}
 
-        game = GameService.create_game(form_data, game_night_id=game_night.id)
+        game = GameService.create_game(form_data, game_night_id=game_night_id)
 
         assert game.id is not None
         assert game.name == 'New Game'
         assert game.type == 'standard'
         assert game.sequence_number == 1
-        assert game.game_night_id == game_night.id
+        assert game.game_night_id == game_night_id
 
-    def test_create_game_with_penalties(self, db_session, game_night):
+    def test_create_game_with_penalties(self, db_session, game_night_id):
         """Test creating game with penalties."""
         form_data = {
+            **BASE_FORM,
             'name': 'Game with Penalties',
-            'type': 'standard',
-            'sequence_number': 1,
-            'point_scheme': 1,
             'metric_type': 'time',
-            'scoring_direction': 'lower_better',
-            'public_input': False
+            'scoring_direction': 'lower_better'
         }
 
         penalties_data = [
@@ -80,7 +146,7 @@ class TestGameService:
             {'name': 'Penalty 2', 'value': 5, 'stackable': False}
         ]
 
-        game = GameService.create_game(form_data, penalties_data, game_night_id=game_night.id)
+        game = GameService.create_game(form_data, penalties_data, game_night_id=game_night_id)
 
         penalties = game.penalties.all()
         assert len(penalties) == 2
@@ -88,34 +154,22 @@ class TestGameService:
         assert penalties[0].value == 10
         assert penalties[0].stackable is True
 
-    def test_create_game_shifts_existing_sequences(self, db_session, game_night):
+    def test_create_game_shifts_existing_sequences(self, db_session, game_night_id):
         """Test that creating a game shifts existing game sequences."""
         # Create initial games
-        game1 = Game(name='Game 1', type='standard', sequence_number=1,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        game2 = Game(name='Game 2', type='standard', sequence_number=2,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        db_session.add_all([game1, game2])
-        db_session.commit()
+        game1_id, game2_id = _bulk_create_games(db_session, game_night_id, [
+            {'name': 'Game 1', 'sequence_number': 1},
+            {'name': 'Game 2', 'sequence_number': 2},
+        ])
 
         # Insert new game at position 2
-        form_data = {
-            'name': 'Inserted Game',
-            'type': 'standard',
-            'sequence_number': 2,
-            'point_scheme': 1,
-            'metric_type': 'score',
-            'scoring_direction': 'higher_better',
-            'public_input': False
-        }
+        form_data = {**BASE_FORM, 'name': 'Inserted Game', 'sequence_number': 2}
 
-        new_game = GameService.create_game(form_data, game_night_id=game_night.id)
+        new_game = GameService.create_game(form_data, game_night_id=game_night_id)
 
-        # Refresh games
-        db_session.refresh(game1)
-        db_session.refresh(game2)
+        # Re-read both games from the database in one query
+        db_session.expire_all()
+        game1, game2 = _load_games(db_session, [game1_id, game2_id])
 
         # Original game1 should still be at 1
         assert game1.sequence_number == 1
@@ -127,6 +181,7 @@ class TestGameService:
     def test_update_game(self, db_session, game):
         """Test updating game."""
         form_data = {
+            **BASE_FORM,
             'name': 'Updated Game',
             'type': 'tournament',
             'sequence_number': game.sequence_number,
@@ -143,38 +198,23 @@ class TestGameService:
         assert updated_game.point_scheme == 2
         assert updated_game.public_input is True
 
-    def test_update_game_sequence_reordering(self, db_session, game_night):
+    def test_update_game_sequence_reordering(self, db_session, game_night_id):
         """Test that updating game sequence reorders other games."""
         # Create games with sequence 1, 2, 3
-        game1 = Game(name='Game 1', type='standard', sequence_number=1,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        game2 = Game(name='Game 2', type='standard', sequence_number=2,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        game3 = Game(name='Game 3', type='standard', sequence_number=3,
-                    game_night_id=game_night.id, point_scheme=1,
-                    metric_type='score', scoring_direction='higher_better')
-        db_session.add_all([game1, game2, game3])
-        db_session.commit()
+        game1_id, game2_id, game3_id = _bulk_create_games(db_session, game_night_id, [
+            {'name': 'Game 1', 'sequence_number': 1},
+            {'name': 'Game 2', 'sequence_number': 2},
+            {'name': 'Game 3', 'sequence_number': 3},
+        ])
 
         # Move game3 to position 1 (should shift others down)
-        form_data = {
-            'name': 'Game 3',
-            'type': 'standard',
-            'sequence_number': 1,
-            'point_scheme': 1,
-            'metric_type': 'score',
-            'scoring_direction': 'higher_better',
-            'public_input': False
-        }
+        form_data = {**BASE_FORM, 'name': 'Game 3', 'sequence_number': 1}
 
-        GameService.update_game(game3.id, form_data)
+        GameService.update_game(game3_id, form_data)
 
-        # Refresh all games
-        db_session.refresh(game1)
-        db_session.refresh(game2)
-        db_session.refresh(game3)
+        # Re-read all games from the database in one query
+        db_session.expire_all()
+        game1, game2, game3 = _load_games(db_session, [game1_id, game2_id, game3_id])
 
         # Verify reordering
         assert game3.sequence_number == 1
@@ -185,104 +225,78 @@ class TestGameService:
         """Test deleting a game."""
         game_id = game.id
 
-        # Add a score
+        # Add a score and a penalty
         score = Score(game_id=game_id, team_id=teams[0].id, score_value=100, points=3)
-        db_session.add(score)
-        db_session.commit()
-
-        # Add a penalty
         penalty = Penalty(game_id=game_id, name='Test Penalty', value=10)
-        db_session.add(penalty)
+        db_session.add_all([score, penalty])
         db_session.commit()
 
         # Verify game and related data exist
-        assert Game.query.get(game_id) is not None
-        assert len(Score.query.filter_by(game_id=game_id).all()) == 1
-        assert len(Penalty.query.filter_by(game_id=game_id).all()) == 1
+        assert db_session.get(Game, game_id) is not None
+        assert _count(db_session, Score.game_id, game_id) == 1
+        assert _count(db_session, Penalty.game_id, game_id) == 1
 
         # Delete game
         GameService.delete_game(game_id)
 
         # Verify game and related data are deleted
-        assert Game.query.get(game_id) is None
-        assert len(Score.query.filter_by(game_id=game_id).all()) == 0
-        assert len(Penalty.query.filter_by(game_id=game_id).all()) == 0
+        assert db_session.get(Game, game_id) is None
+        assert _count(db_session, Score.game_id, game_id) == 0
+        assert _count(db_session, Penalty.game_id, game_id) == 0
 
     def test_delete_game_with_tournament(self, db_session, game, teams):
         """Test deleting a game with tournament cascades properly."""
         game_id = game.id
 
-        # Create a tournament for this game
-        tournament = Tournament(
-            game_id=game_id,
-            pairing_type='random',
-            bracket_style='standard',
-            public_edit=False
-        )
-        db_session.add(tournament)
-        db_session.commit()
-
-        # Create matches
-        match = Match(
-            tournament_id=tournament.id,
-            round_number=1,
-            position_in_round=1,
-            team1_id=teams[0].id,
-            team2_id=teams[1].id
-        )
-        db_session.add(match)
-        db_session.commit()
+        # Create a tournament for this game with one match
+        with single_commit(db_session):
+            tournament_id, = bulk_insert(db_session, Tournament, [{
+                'game_id': game_id,
+                'pairing_type': 'random',
+                'bracket_style': 'standard',
+                'public_edit': False
+            }])
+            bulk_insert(db_session, Match, [{
+                'tournament_id': tournament_id,
+                'round_number': 1,
+                'position_in_round': 1,
+                'team1_id': teams[0].id,
+                'team2_id': teams[1].id
+            }])
 
         # Verify tournament and matches exist
-        assert Tournament.query.filter_by(game_id=game_id).first() is not None
-        assert len(Match.query.filter_by(tournament_id=tournament.id).all()) == 1
+        assert _count(db_session, Tournament.game_id, game_id) == 1
+        assert _count(db_session, Match.tournament_id, tournament_id) == 1
 
         # Delete game
         GameService.delete_game(game_id)
 
         # Verify game, tournament, and matches are deleted
-        assert Game.query.get(game_id) is None
-        assert Tournament.query.filter_by(game_id=game_id).first() is None
+        assert db_session.get(Game, game_id) is None
+        assert _count(db_session, Tournament.game_id, game_id) == 0
         # Matches should be cascade deleted with tournament
-        assert len(Match.query.filter_by(tournament_id=tournament.id).all()) == 0
+        assert _count(db_session, Match.tournament_id, tournament_id) == 0
 
     def test_delete_game_not_found(self, db_session):
         """Test deleting non-existent game raises 404."""
-        with pytest.raises(Exception):
+        with pytest.raises(NotFound):
             GameService.delete_game(99999)
 
-    def test_get_completed_games(self, db_session, game_night):
-        """Test getting only completed games."""
-        game1 = Game(name='Completed 1', type='standard', sequence_number=1,
-                    game_night_id=game_night.id, isCompleted=True,
-                    point_scheme=1, metric_type='score', scoring_direction='higher_better')
-        game2 = Game(name='Not Completed', type='standard', sequence_number=2,
-                    game_night_id=game_night.id, isCompleted=False,
-                    point_scheme=1, metric_type='score', scoring_direction='higher_better')
-        game3 = Game(name='Completed 2', type='standard', sequence_number=3,
-                    game_night_id=game_night.id, isCompleted=True,
-                    point_scheme=1, metric_type='score', scoring_direction='higher_better')
-        db_session.add_all([game1, game2, game3])
-        db_session.commit()
-
-        completed = GameService.get_completed_games()
-        assert len(completed) == 2
-        assert all(g.isCompleted for g in completed)
-
-    def test_get_upcoming_games(self, db_session, game_night):
-        """Test getting only upcoming games."""
-        game1 = Game(name='Completed', type='standard', sequence_number=1,
-                    game_night_id=game_night.id, isCompleted=True,
-                    point_scheme=1, metric_type='score', scoring_direction='higher_better')
-        game2 = Game(name='Upcoming 1', type='standard', sequence_number=2,
-                    game_night_id=game_night.id, isCompleted=False,
-                    point_scheme=1, metric_type='score', scoring_direction='higher_better')
-        game3 = Game(name='Upcoming 2', type='standard', sequence_number=3,
-                    game_night_id=game_night.id, isCompleted=False,
-                    point_scheme=1, metric_type='score', scoring_direction='higher_better')
-        db_session.add_all([game1, game2, game3])
-        db_session.commit()
-
-        upcoming = GameService.get_upcoming_games()
-        assert len(upcoming) == 2
-        assert all(not g.isCompleted for g in upcoming)
+    @pytest.mark.parametrize('method, completed', [
+        ('get_completed_games', True),
+        ('get_upcoming_games', False),
+    ])
+    def test_get_games_by_completion(self, db_session, game_night_id, method, completed):
+        """Test that completed and upcoming listings only return matching games."""
+        game_ids = _bulk_create_games(db_session, game_night_id, [
+            {'name': 'Completed 1', 'sequence_number': 1, 'isCompleted': True},
+            {'name': 'Upcoming 1', 'sequence_number': 2},
+            {'name': 'Completed 2', 'sequence_number': 3, 'isCompleted': True},
+            {'name': 'Upcoming 2', 'sequence_number': 4},
+        ])
+        expected = game_ids[0::2] if completed else game_ids[1::2]
+
+        games = getattr(GameService, method)()
+
+        assert [g.id for g in games] == expected
+        assert all(g.isCompleted is completed for g in games)
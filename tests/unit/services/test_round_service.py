@@ -1,8 +1,67 @@
 """Comprehensive unit tests for RoundService."""
 import pytest
+from types import SimpleNamespace
 from sqlalchemy.exc import SQLAlchemyError
 from app.services.round_service import RoundService
-from app.models import Round, RoundScore, Game, Team
+from app.models import Round, RoundScore, Game, GameNight, Team
+from tests.factories import GameFactory, GameNightFactory, TeamFactory, bulk_insert
+from tests.utils import assert_num_queries, seeded_row, seeded_rows, seeded_savepoint, single_commit
+
+
+def _bulk_save_scores(db_session, round_ids, team_ids, score_value, points):
+    """Insert a RoundScore for every round/team pair in one statement.
+
+    score_value and points are called with the team's index in team_ids,
+    so each team can get its own values. Use RoundService.save_round_score
+    instead when the test is about how scores get saved.
+    """
+    return bulk_insert(db_session, RoundScore, [
+        {'round_id': round_id, 'team_id': team_id,
+         'score_value': score_value(i), 'points': points(i)}
+        for round_id in round_ids
+        for i, team_id in enumerate(team_ids)
+    ])
+
+
+def _seed_round_game(session):
+    """Insert a game night with three teams and one game."""
+    with single_commit(session):
+        game_night = GameNightFactory.create(session)
+        teams = TeamFactory.create_batch(session, count=3, game_night_id=game_night.id,
+                                         participant_count=0)
+        game = GameFactory.create(session, game_night_id=game_night.id, game_type='trivia')
+    return SimpleNamespace(
+        game_night_id=game_night.id,
+        team_ids=[team.id for team in teams],
+        game_id=game.id
+    )
+
+
+def _seed_round(session, game_id):
+    """Insert round 1 of the given game."""
+    return SimpleNamespace(
+        round_id=bulk_insert(session, Round, [{'game_id': game_id, 'round_number': 1}])[0]
+    )
+
+
+@pytest.fixture(scope='module')
+def round_game(app, db_connection):
+    """Seed a game night, three teams and a game once for this module."""
+    with seeded_savepoint(app, db_connection, _seed_round_game) as ids:
+        yield ids
+
+
+@pytest.fixture(scope='class')
+def class_round(app, db_connection, round_game):
+    """Seed one round of the module's game for a whole test class."""
+    with seeded_savepoint(app, db_connection, _seed_round, round_game.game_id) as ids:
+        yield ids
+
+
+game_night = seeded_row(GameNight, 'round_game', 'game_night_id')
+teams = seeded_rows(Team, 'round_game', 'team_ids')
+game = seeded_row(Game, 'round_game', 'game_id')
+single_round = seeded_row(Round, 'class_round', 'round_id')
 
 
 @pytest.mark.unit
@@ -51,7 +110,11 @@ class TestRoundServiceCreateRounds:
 
     def test_create_max_rounds(self, db_session, game):
         """Test creating maximum number of rounds (50)."""
-        rounds = RoundService.create_rounds_for_game(game.id, 50)
+        # Existence check, one executemany INSERT, read-back. The game
+        # fixture already put the Game in the identity map, so the service's
+        # Game.query.get issues no SQL here; a cold call runs 4 statements.
+        with assert_num_queries(db_session, 3):
+            rounds = RoundService.create_rounds_for_game(game.id, 50)
 
         assert len(rounds) == 50
         assert rounds[0].round_number == 1
@@ -161,39 +224,33 @@ class TestRoundServiceGetRounds:
 class TestRoundServiceSaveScores:
     """Test suite for saving round scores."""
 
-    def test_save_round_score(self, db_session, game, teams):
+    def test_save_round_score(self, db_session, single_round, teams):
         """Test saving a score for a round."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
         round_score = RoundService.save_round_score(
-            rounds[0].id, teams[0].id, 100.0, 10
+            single_round.id, teams[0].id, 100.0, 10
         )
 
-        assert round_score.round_id == rounds[0].id
+        assert round_score.round_id == single_round.id
         assert round_score.team_id == teams[0].id
         assert round_score.score_value == 100.0
         assert round_score.points == 10
 
-    def test_save_round_score_with_notes(self, db_session, game, teams):
+    def test_save_round_score_with_notes(self, db_session, single_round, teams):
         """Test saving a round score with notes."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
         round_score = RoundService.save_round_score(
-            rounds[0].id, teams[0].id, 95.5, 8, notes="Great job!"
+            single_round.id, teams[0].id, 95.5, 8, notes="Great job!"
         )
 
         assert round_score.notes == "Great job!"
 
-    def test_update_existing_round_score(self, db_session, game, teams):
+    def test_update_existing_round_score(self, db_session, single_round, teams):
         """Test updating an existing round score."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
         # Save initial score
-        RoundService.save_round_score(rounds[0].id, teams[0].id, 100.0, 10)
+        RoundService.save_round_score(single_round.id, teams[0].id, 100.0, 10)
 
         # Update score
         updated_score = RoundService.save_round_score(
-            rounds[0].id, teams[0].id, 120.0, 12
+            single_round.id, teams[0].id, 120.0, 12
         )
 
         assert updated_score.score_value == 120.0
@@ -201,7 +258,7 @@ class TestRoundServiceSaveScores:
 
         # Verify only one score exists
         scores = RoundScore.query.filter_by(
-            round_id=rounds[0].id, team_id=teams[0].id
+            round_id=single_round.id, team_id=teams[0].id
         ).all()
         assert len(scores) == 1
 
@@ -210,47 +267,25 @@ class TestRoundServiceSaveScores:
         with pytest.raises(ValueError, match="Round with ID 99999 not found"):
             RoundService.save_round_score(99999, teams[0].id, 100.0, 10)
 
-    def test_save_score_invalid_team(self, db_session, game):
+    def test_save_score_invalid_team(self, db_session, single_round):
         """Test saving score for invalid team fails."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
         with pytest.raises(ValueError, match="Team with ID 99999 not found"):
-            RoundService.save_round_score(rounds[0].id, 99999, 100.0, 10)
+            RoundService.save_round_score(single_round.id, 99999, 100.0, 10)
 
-    def test_save_zero_score(self, db_session, game, teams):
-        """Test saving zero as valid score."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
+    @pytest.mark.parametrize('score_value,points', [
+        (0.0, 0),                # zero is a valid score
+        (-50.0, -5),             # negative scores (for penalties)
+        (123.456, 5),            # decimal/float scores
+        (None, 0),               # no score value
+        (999999.99, 100),        # maximum score value
+        (-999999.99, -100),      # minimum score value
+    ])
+    def test_save_score_values(self, db_session, single_round, teams, score_value, points):
+        """Test saving edge-case score values as given."""
+        round_score = RoundService.save_round_score(single_round.id, teams[0].id, score_value, points)
 
-        round_score = RoundService.save_round_score(rounds[0].id, teams[0].id, 0.0, 0)
-
-        assert round_score.score_value == 0.0
-        assert round_score.points == 0
-
-    def test_save_negative_score(self, db_session, game, teams):
-        """Test saving negative score (for penalties)."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
-        round_score = RoundService.save_round_score(rounds[0].id, teams[0].id, -50.0, -5)
-
-        assert round_score.score_value == -50.0
-        assert round_score.points == -5
-
-    def test_save_decimal_score(self, db_session, game, teams):
-        """Test saving decimal/float score."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
-        round_score = RoundService.save_round_score(rounds[0].id, teams[0].id, 123.456, 5)
-
-        assert round_score.score_value == 123.456
-
-    def test_save_none_score_value(self, db_session, game, teams):
-        """Test saving None as score value."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
-        round_score = RoundService.save_round_score(rounds[0].id, teams[0].id, None, 0)
-
-        assert round_score.score_value is None
-        assert round_score.points == 0
+        assert round_score.score_value == score_value
+        assert round_score.points == points
 
 
 @pytest.mark.unit
@@ -258,59 +293,52 @@ class TestRoundServiceSaveScores:
 class TestRoundServiceGetScores:
     """Test suite for retrieving round scores."""
 
-    def test_get_round_scores(self, db_session, game, teams):
+    def test_get_round_scores(self, db_session, single_round, teams):
         """Test getting all scores for a round."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
         # Save scores for all teams
-        for i, team in enumerate(teams):
-            RoundService.save_round_score(rounds[0].id, team.id, 100 - i*10, 10 - i)
+        _bulk_save_scores(db_session, [single_round.id], [t.id for t in teams],
+                          lambda i: 100 - i*10, lambda i: 10 - i)
 
-        scores = RoundService.get_round_scores(rounds[0].id)
+        scores = RoundService.get_round_scores(single_round.id)
 
         assert len(scores) == len(teams)
 
-    def test_get_round_scores_ordered(self, db_session, game, teams):
+    def test_get_round_scores_ordered(self, db_session, single_round, teams):
         """Test scores are returned ordered by points descending."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
         # Save scores in random order
-        RoundService.save_round_score(rounds[0].id, teams[0].id, 80, 5)
-        RoundService.save_round_score(rounds[0].id, teams[1].id, 100, 10)
-        RoundService.save_round_score(rounds[0].id, teams[2].id, 90, 7)
+        bulk_insert(db_session, RoundScore, [
+            {'round_id': single_round.id, 'team_id': teams[0].id, 'score_value': 80, 'points': 5},
+            {'round_id': single_round.id, 'team_id': teams[1].id, 'score_value': 100, 'points': 10},
+            {'round_id': single_round.id, 'team_id': teams[2].id, 'score_value': 90, 'points': 7},
+        ])
 
-        scores = RoundService.get_round_scores(rounds[0].id, ordered=True)
+        scores = RoundService.get_round_scores(single_round.id, ordered=True)
 
         assert scores[0].points == 10
         assert scores[1].points == 7
         assert scores[2].points == 5
 
-    def test_get_round_scores_unordered(self, db_session, game, teams):
+    def test_get_round_scores_unordered(self, db_session, single_round, teams):
         """Test getting unordered scores."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
-        for team in teams:
-            RoundService.save_round_score(rounds[0].id, team.id, 100, 10)
+        _bulk_save_scores(db_session, [single_round.id], [t.id for t in teams],
+                          lambda i: 100, lambda i: 10)
 
-        scores = RoundService.get_round_scores(rounds[0].id, ordered=False)
+        scores = RoundService.get_round_scores(single_round.id, ordered=False)
         assert len(scores) == len(teams)
 
-    def test_get_round_score_for_team(self, db_session, game, teams):
+    def test_get_round_score_for_team(self, db_session, single_round, teams):
         """Test getting specific team's score for a round."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-        RoundService.save_round_score(rounds[0].id, teams[0].id, 100, 10)
+        RoundService.save_round_score(single_round.id, teams[0].id, 100, 10)
 
-        score = RoundService.get_round_score_for_team(rounds[0].id, teams[0].id)
+        score = RoundService.get_round_score_for_team(single_round.id, teams[0].id)
 
         assert score is not None
         assert score.team_id == teams[0].id
         assert score.score_value == 100
 
-    def test_get_round_score_for_team_not_found(self, db_session, game, teams):
+    def test_get_round_score_for_team_not_found(self, db_session, single_round, teams):
         """Test getting score for team that hasn't scored returns None."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
-        score = RoundService.get_round_score_for_team(rounds[0].id, teams[0].id)
+        score = RoundService.get_round_score_for_team(single_round.id, teams[0].id)
         assert score is None
 
 
@@ -329,11 +357,8 @@ class TestRoundServiceCumulativeScores:
         rounds = RoundService.create_rounds_for_game(game.id, 3)
 
         # Add scores for each team in each round
-        for round_obj in rounds:
-            for i, team in enumerate(teams):
-                RoundService.save_round_score(
-                    round_obj.id, team.id, 100 - i*10, 10 - i
-                )
+        _bulk_save_scores(db_session, [r.id for r in rounds], [t.id for t in teams],
+                          lambda i: 100 - i*10, lambda i: 10 - i)
 
         cumulative = RoundService.get_cumulative_scores_for_game(game.id)
 
@@ -370,12 +395,12 @@ class TestRoundServiceCumulativeScores:
         rounds = RoundService.create_rounds_for_game(game.id, 3)
 
         # Team 0 plays all rounds
-        for round_obj in rounds:
-            RoundService.save_round_score(round_obj.id, teams[0].id, 100, 10)
+        _bulk_save_scores(db_session, [r.id for r in rounds], [teams[0].id],
+                          lambda i: 100, lambda i: 10)
 
         # Team 1 plays only 2 rounds
-        RoundService.save_round_score(rounds[0].id, teams[1].id, 100, 10)
-        RoundService.save_round_score(rounds[1].id, teams[1].id, 100, 10)
+        _bulk_save_scores(db_session, [rounds[0].id, rounds[1].id], [teams[1].id],
+                          lambda i: 100, lambda i: 10)
 
         cumulative = RoundService.get_cumulative_scores_for_game(game.id)
 
@@ -550,8 +575,8 @@ class TestRoundServiceDelete:
         rounds = RoundService.create_rounds_for_game(game.id, 1)
 
         # Add scores
-        for team in teams:
-            RoundService.save_round_score(rounds[0].id, team.id, 100, 10)
+        _bulk_save_scores(db_session, [rounds[0].id], [t.id for t in teams],
+                          lambda i: 100, lambda i: 10)
 
         # Verify scores exist
         scores_count = RoundScore.query.filter_by(round_id=rounds[0].id).count()
@@ -610,52 +635,23 @@ class TestRoundServiceBoundary:
         rounds = RoundService.create_rounds_for_game(game.id, 50)
         assert len(rounds) == 50
 
-    def test_save_score_with_max_value(self, db_session, game, teams):
-        """Test saving maximum score value."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
-        max_score = 999999.99
-        round_score = RoundService.save_round_score(
-            rounds[0].id, teams[0].id, max_score, 100
-        )
-
-        assert round_score.score_value == max_score
-
-    def test_save_score_with_min_value(self, db_session, game, teams):
-        """Test saving minimum score value."""
-        rounds = RoundService.create_rounds_for_game(game.id, 1)
-
-        min_score = -999999.99
-        round_score = RoundService.save_round_score(
-            rounds[0].id, teams[0].id, min_score, -100
-        )
-
-        assert round_score.score_value == min_score
-
-    def test_cumulative_with_max_teams(self, db_session, game_night, game):
+    def test_cumulative_with_max_teams(self, db_session, game_night, game, teams):
         """Test cumulative calculation with many teams."""
         game.has_rounds = True
         db_session.commit()
 
-        # Create 20 teams (simulating larger tournament)
-        teams = []
-        for i in range(20):
-            team = Team(
-                name=f'Team {i}',
-                color=f'#{i:06x}',
-                game_night_id=game_night.id
-            )
-            db_session.add(team)
-            teams.append(team)
-        db_session.commit()
+        # Grow the seeded teams to 20 (simulating larger tournament)
+        team_ids = [t.id for t in teams] + bulk_insert(db_session, Team, [
+            {'name': f'Team {i}', 'color': f'#{i:06x}', 'game_night_id': game_night.id}
+            for i in range(len(teams), 20)
+        ])
 
         # Create 10 rounds
         rounds = RoundService.create_rounds_for_game(game.id, 10)
 
         # Add scores for all teams in all rounds
-        for round_obj in rounds:
-            for i, team in enumerate(teams):
-                RoundService.save_round_score(round_obj.id, team.id, 100-i, 20-i)
+        _bulk_save_scores(db_session, [r.id for r in rounds], team_ids,
+                          lambda i: 100 - i, lambda i: 20 - i)
 
         cumulative = RoundService.get_cumulative_scores_for_game(game.id)
 
@@ -663,8 +659,8 @@ class TestRoundServiceBoundary:
         assert len(cumulative) == 20
 
         # Verify all teams have all rounds
-        for team in teams:
-            assert len(cumulative[team.id]['rounds']) == 10
+        for team_id in team_ids:
+            assert len(cumulative[team_id]['rounds']) == 10
 
     def test_save_very_long_notes(self, db_session, game, teams):
         """Test saving long notes string."""
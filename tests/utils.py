@@ -1,6 +1,138 @@
 """Test utility functions."""
+import inspect
 from contextlib import contextmanager
-from tests.factories import GameNightFactory, TeamFactory, GameFactory
+import pytest
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, select
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from app import db
+from app.models import Match
+from tests.factories import DEFER_COMMIT, GameNightFactory, TeamFactory, GameFactory
+
+
+class ConnectionBoundSession(Session):
+    """Flask-SQLAlchemy session that honours an explicit connection bind.
+
+    The stock session always resolves the app's engine, so it could never
+    join the SAVEPOINTs opened by the test fixtures.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.bind is not None:
+            return self.bind
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@contextmanager
+def bound_session(connection):
+    """Point db.session at connection for the duration of the block.
+
+    Commits inside the block become SAVEPOINT releases, so whatever
+    transaction the caller opened on connection decides what persists.
+
+    Args:
+        connection: Connection with an open transaction
+
+    Example:
+        with bound_session(db_connection) as session:
+            GameNightFactory.create(session)
+    """
+    app_session = db.session
+    app_session.remove()
+    db.session = db._make_scoped_session({
+        'class_': ConnectionBoundSession,
+        'bind': connection,
+        'join_transaction_mode': 'create_savepoint',
+    })
+    try:
+        yield db.session
+    finally:
+        db.session.remove()
+        db.session = app_session
+
+
+@contextmanager
+def seeded_savepoint(app, connection, seed, *args):
+    """Seed rows shared by every test in a module or class.
+
+    seed(session, *args) runs once and returns what the tests need,
+    normally a SimpleNamespace of ids. Its rows live in a SAVEPOINT on
+    connection that stays open until the block exits, so each test only
+    rolls back its own changes on top of them. Only ids should be shared;
+    load instances per test with seeded_row or seeded_rows.
+
+    Args:
+        app: Flask application
+        connection: Connection with an open transaction
+        seed: Callable that inserts the rows through the given session
+        *args: Extra arguments passed on to seed
+
+    Example:
+        @pytest.fixture(scope='class')
+        def class_tournament(app, db_connection):
+            with seeded_savepoint(app, db_connection, _seed_tournament) as ids:
+                yield ids
+    """
+    savepoint = connection.begin_nested()
+    try:
+        with app.app_context(), bound_session(connection) as session:
+            seeded = seed(session, *args)
+        yield seeded
+    finally:
+        savepoint.rollback()
+
+
+def _seeded_fixture(load, seed, doc):
+    """Turn load(db_session, seeded_ids) into a fixture that requests seed.
+
+    The seed fixture has to be a real argument rather than a
+    request.getfixturevalue() call, so pytest sets it up before
+    db_session and the test's SAVEPOINT nests inside the seed's.
+    """
+    def fixture(db_session, **seeded):
+        return load(db_session, seeded[seed])
+
+    fixture.__signature__ = inspect.Signature([
+        inspect.Parameter('db_session', inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        inspect.Parameter(seed, inspect.Parameter.KEYWORD_ONLY),
+    ])
+    fixture.__doc__ = doc
+    return pytest.fixture(fixture)
+
+
+def seeded_row(model, seed, id_attr):
+    """Build a fixture that loads one seeded row into the test's session.
+
+    Args:
+        model: Model class to load
+        seed: Name of the fixture holding the seeded ids
+        id_attr: Attribute of the seeded ids naming the row's id
+
+    Example:
+        tournament = seeded_row(Tournament, 'class_tournament', 'tournament_id')
+    """
+    return _seeded_fixture(
+        lambda db_session, ids: db_session.get(model, getattr(ids, id_attr)),
+        seed,
+        f"Load the {model.__name__} seeded by {seed} into the test's session."
+    )
+
+
+def seeded_rows(model, seed, ids_attr):
+    """Build a fixture that loads a list of seeded rows, ordered by id.
+
+    Args:
+        model: Model class to load
+        seed: Name of the fixture holding the seeded ids
+        ids_attr: Attribute of the seeded ids naming the rows' ids
+    """
+    return _seeded_fixture(
+        lambda db_session, ids: db_session.scalars(
+            select(model).where(model.id.in_(getattr(ids, ids_attr))).order_by(model.id)
+        ).all(),
+        seed,
+        f"Load the {model.__name__} rows seeded by {seed} into the test's session."
+    )
 
 
 @contextmanager
@@ -26,6 +158,38 @@ def assert_raises_with_message(exception_class, message_substring):
             f"Expected message to contain '{message_substring}', got '{str(e)}'"
 
 
+@contextmanager
+def single_commit(db_session):
+    """Group several writes into one transaction committed on exit.
+
+    Steps inside the block can flush() when they need generated values,
+    and factories only flush instead of committing each instance; the
+    block rolls back instead if it raises. A block nested in another one
+    flushes on exit and leaves the commit to the outermost block.
+
+    Args:
+        db_session: Database session
+
+    Example:
+        with single_commit(db_session):
+            match.status = 'in_progress'
+            match.status = 'completed'
+    """
+    outer = db_session.info.get(DEFER_COMMIT, False)
+    db_session.info[DEFER_COMMIT] = True
+    try:
+        yield db_session
+    except Exception:
+        db_session.rollback()
+        raise
+    finally:
+        db_session.info[DEFER_COMMIT] = outer
+    if outer:
+        db_session.flush()
+    else:
+        db_session.commit()
+
+
 def create_complete_game_night(db_session, name='Test GN', team_count=3, game_count=2):
     """Create a complete game night with teams and games.
 
@@ -38,27 +202,101 @@ def create_complete_game_night(db_session, name='Test GN', team_count=3, game_co
     Returns:
         Tuple of (game_night, teams, games)
     """
-    gn = GameNightFactory.create(db_session, name=name)
-
-    teams = TeamFactory.create_batch(
-        db_session,
-        count=team_count,
-        game_night_id=gn.id
-    )
+    with single_commit(db_session):
+        gn = GameNightFactory.create(db_session, name=name)
 
-    games = []
-    for i in range(1, game_count + 1):
-        game = GameFactory.create(
+        teams = TeamFactory.create_batch(
             db_session,
-            name=f'Game {i}',
-            game_night_id=gn.id,
-            sequence_number=i
+            count=team_count,
+            game_night_id=gn.id
         )
-        games.append(game)
+
+        games = []
+        for i in range(1, game_count + 1):
+            game = GameFactory.create(
+                db_session,
+                name=f'Game {i}',
+                game_night_id=gn.id,
+                sequence_number=i
+            )
+            games.append(game)
 
     return gn, teams, games
 
 
+def load_match_full(db_session, match_id):
+    """Load a match with its team relationships in one joined SELECT.
+
+    Args:
+        db_session: Database session
+        match_id: ID of match to load
+
+    Returns:
+        Match instance with team1, team2 and winner_team loaded
+    """
+    return db_session.execute(
+        select(Match).options(
+            joinedload(Match.team1),
+            joinedload(Match.team2),
+            joinedload(Match.winner_team)
+        ).filter_by(id=match_id)
+    ).scalar_one()
+
+
+def load_strict(db_session, model, pk, *relationships):
+    """Reload a row with only the given relationships available.
+
+    The relationships are eager-loaded and every other relationship on
+    the instance raises on access, so an unplanned lazy load fails the
+    test instead of quietly adding a query.
+
+    Args:
+        db_session: Database session
+        model: Model class to load
+        pk: Primary key of the row
+        *relationships: Relationship attributes to eager-load
+
+    Returns:
+        Model instance
+    """
+    options = [selectinload(rel) for rel in relationships]
+    return db_session.get(model, pk, options=[*options, raiseload('*')], populate_existing=True)
+
+
+@contextmanager
+def assert_num_queries(db_session, expected):
+    """Assert the block runs exactly the expected number of SQL statements.
+
+    SAVEPOINT bookkeeping from the test fixtures is not counted, so the
+    number only reflects the queries the code under test issues.
+
+    Args:
+        db_session: Database session
+        expected: Number of statements the block should execute
+
+    Raises:
+        AssertionError: If a different number of statements ran
+
+    Example:
+        with assert_num_queries(db_session, 1):
+            matches = tournament.matches.all()
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')):
+            statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, 'before_cursor_execute', record)
+    assert len(statements) == expected, \
+        f"Expected {expected} queries, got {len(statements)}: {statements}"
+
+
 def assert_cascade_delete(db_session, model, deleted_id, should_exist=False):
     """Assert that a record was cascade deleted (or preserved).
 